@@ -0,0 +1,109 @@
+"""Streaming Atom feed parsing backed by lxml.
+
+Entries are converted to plain dicts shaped for ``Paper.model_validate`` as soon
+as their ``</entry>`` closes, so large feeds are never held as a full tree.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from .errors import AcademicParseError
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+OPENSEARCH_NS = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+_ENTRY_TAG = ATOM_NS + "entry"
+_OPENSEARCH_FIELDS = {
+    OPENSEARCH_NS + "totalResults": "total_results",
+    OPENSEARCH_NS + "startIndex": "start_index",
+    OPENSEARCH_NS + "itemsPerPage": "items_per_page",
+}
+# Child elements whose text maps straight onto a Paper field
+_TEXT_FIELDS = {
+    ATOM_NS + "id": "id",
+    ATOM_NS + "title": "title",
+    ATOM_NS + "summary": "summary",
+    ATOM_NS + "published": "published",
+    ATOM_NS + "updated": "updated",
+    ARXIV_NS + "comment": "arxiv_comment",
+    ARXIV_NS + "journal_ref": "journal_ref",
+    ARXIV_NS + "doi": "doi",
+}
+_AUTHOR_TAG = ATOM_NS + "author"
+_AUTHOR_NAME_TAG = ATOM_NS + "name"
+_AFFILIATION_TAG = ARXIV_NS + "affiliation"
+_LINK_TAG = ATOM_NS + "link"
+_CATEGORY_TAG = ATOM_NS + "category"
+_PRIMARY_CATEGORY_TAG = ARXIV_NS + "primary_category"
+
+
+def entry_to_dict(entry: "etree._Element") -> Dict[str, Any]:
+    """Convert an Atom ``<entry>`` element into a dict of Paper fields."""
+    data: Dict[str, Any] = {"authors": [], "links": [], "tags": []}
+    for child in entry:
+        tag = child.tag
+        field = _TEXT_FIELDS.get(tag)
+        if field is not None:
+            data[field] = child.text
+        elif tag == _AUTHOR_TAG:
+            author: Dict[str, Any] = {"name": child.findtext(_AUTHOR_NAME_TAG)}
+            affiliations = [a.text for a in child.iterfind(_AFFILIATION_TAG) if a.text]
+            if affiliations:
+                author["affiliations"] = affiliations
+            data["authors"].append(author)
+        elif tag == _LINK_TAG:
+            data["links"].append(dict(child.attrib))
+        elif tag == _CATEGORY_TAG:
+            data["tags"].append({"term": child.get("term"), "scheme": child.get("scheme"), "label": child.get("label")})
+        elif tag == _PRIMARY_CATEGORY_TAG:
+            data["primary_category"] = child.get("term")
+    return data
+
+
+class AtomStreamParser:
+    """Incremental Atom parser.
+
+    Feed response bytes as they arrive; completed entries accumulate in
+    ``entries`` and OpenSearch paging values in ``meta``.
+    """
+
+    def __init__(self):
+        self._parser = etree.XMLPullParser(events=("end",), resolve_entities=False, no_network=True)
+        self.meta: Dict[str, Optional[str]] = {}
+        self.entries: List[Dict[str, Any]] = []
+
+    def feed(self, data: bytes) -> None:
+        try:
+            self._parser.feed(data)
+        except etree.XMLSyntaxError as e:
+            raise AcademicParseError(f"Malformed Atom feed: {e}") from e
+        self._drain()
+
+    def close(self) -> None:
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError as e:
+            raise AcademicParseError(f"Malformed Atom feed: {e}") from e
+        self._drain()
+
+    def _drain(self) -> None:
+        for _, elem in self._parser.read_events():
+            tag = elem.tag
+            if tag == _ENTRY_TAG:
+                self.entries.append(entry_to_dict(elem))
+                # free the finished entry and any already-processed siblings
+                elem.clear()
+                parent = elem.getparent()
+                while elem.getprevious() is not None:
+                    del parent[0]
+            elif tag in _OPENSEARCH_FIELDS:
+                self.meta[_OPENSEARCH_FIELDS[tag]] = elem.text
+
+
+def parse_feed(data: bytes) -> Tuple[Dict[str, Optional[str]], List[Dict[str, Any]]]:
+    """Parse a complete Atom document into ``(meta, entries)``."""
+    parser = AtomStreamParser()
+    parser.feed(data)
+    parser.close()
+    return parser.meta, parser.entries
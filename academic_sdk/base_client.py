@@ -1,49 +1,144 @@
 """Base client for academic SDKs."""
 import asyncio
+import functools
+import re
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Optional, List, Union
+from typing import Optional, List, Set, Union
 import os
 import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
 
 from .models import Paper
-from .errors import AcademicNetworkError, AcademicAPIError, AcademicParseError, AcademicDownloadError
+from .ratelimit import TokenBucket
+from .errors import AcademicSDKError, AcademicNetworkError, AcademicAPIError, AcademicParseError, AcademicDownloadError
 
 logger = logging.getLogger(__name__)
 
+# Maps every ASCII character outside [a-z0-9] to '_'; runs are collapsed after.
+_SLUG_TRANS = str.maketrans({chr(c): '_' for c in range(128) if not chr(c).isdigit() and not 'a' <= chr(c) <= 'z'})
+_UNDERSCORE_RUN_RE = re.compile(r"__+")
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _slugify_impl(text: str, maxlen: int) -> str:
+    """Pure slugify helper; cached because titles repeat across bulk downloads."""
+    if not text.isascii():
+        # Only non-ASCII titles need decomposing before the accents are dropped.
+        text = unicodedata.normalize('NFKD', text)
+        text = text.encode('ascii', 'ignore').decode('ascii')
+    text = text.lower().translate(_SLUG_TRANS)
+    text = _UNDERSCORE_RUN_RE.sub('_', text)
+    text = text.strip('_')
+    if len(text) > maxlen:
+        text = text[:maxlen].rstrip('_')
+    return text
+
+
+@functools.lru_cache(maxsize=1024)
+def _category_dirname(cat: str) -> str:
+    """Directory name for a category or venue, e.g. ``cs.LG`` -> ``CS_LG``."""
+    return cat.replace('.', '_').upper() or 'UNKNOWN'
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking filesystem call in the default executor, off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def _discard(path: str) -> None:
+    """Remove ``path`` if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Delay requested by a ``Retry-After`` header: delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
 
 class BaseClient(ABC):
     """Abstract base client for academic APIs."""
 
+    # Model used to validate parsed entries; subclasses narrow this.
+    paper_model = Paper
+
     def __init__(self, base_url: str, user_agent: Optional[str] = None, rate_limit: float = 3.0, max_concurrent: int = 1):
         self.base_url = base_url
         self.user_agent = user_agent or "AcademicSDK/1.0"
         self.rate_limit = rate_limit
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.last_request_time = 0.0
+        # max_concurrent requests may burst within each rate_limit window
+        self._limiter = TokenBucket(max_concurrent, rate_limit)
+        self._mkdir_cache: Set[str] = set()
+        self._session = None  # shared aiohttp.ClientSession, created lazily
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting."""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
-        self.last_request_time = asyncio.get_event_loop().time()
+    async def _get_session(self):
+        """Return the shared HTTP session, creating it on first use.
+
+        Reusing one keep-alive pool avoids a fresh TCP/TLS handshake per request.
+        """
+        if self._session is None or self._session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10),
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _is_retryable(self, e: BaseException) -> bool:
+        """Whether ``e`` is transient: a network error, a timeout, a 429 or a 5xx."""
+        if isinstance(e, (AcademicNetworkError, asyncio.TimeoutError)):
+            return True
+        return isinstance(e, AcademicAPIError) and (e.status == 429 or 500 <= e.status < 600)
 
     async def _retry_request(self, request_func, max_retries=3):
-        """Retry requests with backoff."""
-        backoff = 1
+        """Retry requests with decorrelated-jitter backoff.
+
+        Only errors classified as transient by ``_is_retryable`` are retried;
+        anything else (4xx, parse errors, ...) is raised immediately. A ``retry_after``
+        hint on the exception takes precedence over the computed backoff.
+        """
+        backoff = 1.0
         for attempt in range(max_retries):
             try:
-                async with self.semaphore:
-                    await self._apply_rate_limit()
-                    return await request_func()
-            except (Exception) as e:  # Broad exception for retries
-                if attempt == max_retries - 1:
+                await self._limiter.acquire_async()
+                return await request_func()
+            except (AcademicSDKError, asyncio.TimeoutError) as e:
+                if attempt == max_retries - 1 or not self._is_retryable(e):
                     raise
-                logger.warning("Request failed (attempt %d/3), retrying in %d seconds: %s", attempt + 1, backoff, e)
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 30)
+                backoff = min(30.0, random.uniform(1.0, backoff * 3))
+                retry_after = getattr(e, 'retry_after', None)
+                delay = retry_after if retry_after is not None else backoff
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Request failed (attempt %d/%d), retrying in %.1f seconds: %s", attempt + 1, max_retries, delay, e)
+                await asyncio.sleep(delay)
 
     @abstractmethod
     async def search(self, query: Union[str, object], start: int = 0, max_results: int = 10, timeout: float = 10.0):
@@ -51,9 +146,16 @@ class BaseClient(ABC):
         pass
 
     @abstractmethod
+    async def get_many_by_id(self, paper_ids: List[str], timeout: float = 10.0) -> List[Optional[Paper]]:
+        """Get several papers by ID in as few requests as the API allows.
+
+        Results follow the order of ``paper_ids``; unknown IDs map to ``None``.
+        """
+        pass
+
     async def get_by_id(self, paper_id: str, timeout: float = 10.0) -> Optional[Paper]:
         """Get paper by ID."""
-        pass
+        return (await self.get_many_by_id([paper_id], timeout=timeout))[0]
 
     async def download_pdf(self, paper: Paper, dest_path: str, timeout: float = 20.0, overwrite: bool = False) -> str:
         """Download PDF for a paper."""
@@ -71,46 +173,85 @@ class BaseClient(ABC):
             final_name = f"{title_slug}.pdf"
 
         # Category logic (abstract)
-        category_dir = self._get_category_dir(paper, dest_path)
+        category_dir = await self._get_category_dir(paper, dest_path)
         full = os.path.join(category_dir, final_name)
-        if os.path.exists(full) and not overwrite:
+        if not overwrite and await _run_blocking(os.path.exists, full):
             return full
 
-        # Download logic (to be implemented in subclasses)
         return await self._download_file(pdf_url, full, timeout)
 
+    async def download_many(self, papers: List[Paper], dest_path: str, timeout: float = 20.0, overwrite: bool = False) -> List[str]:
+        """Download PDFs for several papers concurrently.
+
+        Transfers overlap up to ``max_concurrent``, the size of the shared
+        connection pool. Returns the local paths in the same order as ``papers``.
+        """
+        return list(await asyncio.gather(
+            *(self.download_pdf(p, dest_path, timeout=timeout, overwrite=overwrite) for p in papers)
+        ))
+
+    def _parse_atom(self, data: bytes) -> List[Paper]:
+        """Parse an Atom feed body into papers using the streaming lxml parser."""
+        from .atom import parse_feed
+        _, entries = parse_feed(data)
+        try:
+            return [self.paper_model.model_validate(entry) for entry in entries]
+        except ValueError as e:
+            raise AcademicParseError(str(e)) from e
+
     def _slugify(self, text: str, maxlen: int = 80) -> str:
         """Slugify text for filenames."""
         if not text:
             return ''
-        import unicodedata
-        import re
-        text = unicodedata.normalize('NFKD', text)
-        text = text.encode('ascii', 'ignore').decode('ascii')
-        text = text.lower()
-        text = re.sub(r"[^a-z0-9]+", '_', text)
-        text = text.strip('_')
-        if len(text) > maxlen:
-            text = text[:maxlen].rstrip('_')
-        return text or ''
-
-    def _get_category_dir(self, paper: Paper, dest_path: str) -> str:
-        """Get category directory (override in subclasses)."""
+        return _slugify_impl(text, maxlen)
+
+    async def _get_category_dir(self, paper: Paper, dest_path: str) -> str:
+        """Get category directory (override in subclasses).
+
+        Directories are created off the event loop and remembered, so each
+        category costs at most one ``mkdir`` per client.
+        """
         cat = getattr(paper, 'primary_category', None) or getattr(paper, 'venue', None)
-        if cat:
-            try:
-                cat_name = str(cat).replace('.', '_').upper()
-                if not cat_name:
-                    cat_name = 'UNKNOWN'
-            except (AttributeError, TypeError):
-                cat_name = 'UNKNOWN'
-        else:
-            cat_name = 'UNKNOWN'
+        cat_name = _category_dirname(str(cat)) if cat else 'UNKNOWN'
         category_dir = os.path.join(dest_path, cat_name)
-        os.makedirs(category_dir, exist_ok=True)
+        if category_dir not in self._mkdir_cache:
+            await _run_blocking(os.makedirs, category_dir, exist_ok=True)
+            self._mkdir_cache.add(category_dir)
         return category_dir
 
-    @abstractmethod
     async def _download_file(self, url: str, dest: str, timeout: float) -> str:
-        """Download file implementation."""
-        pass
\ No newline at end of file
+        """Stream ``url`` to ``dest`` through the shared session.
+
+        The body is written in chunks to ``dest + '.part'`` and only renamed into
+        place once complete, so an interrupted download never passes the
+        existing-file check in ``download_pdf``.
+        """
+        import aiohttp
+        import aiofiles
+
+        part = dest + '.part'
+
+        async def _do_download():
+            session = await self._get_session()
+            bytes_written = 0
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(part, 'wb') as fh:
+                        async for chunk in resp.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                            await fh.write(chunk)
+                            bytes_written += len(chunk)
+                if bytes_written == 0:
+                    raise AcademicDownloadError("Downloaded file is empty")
+                await _run_blocking(os.replace, part, dest)
+            except aiohttp.ClientResponseError as e:
+                raise AcademicAPIError(e.status, body=e.message) from e
+            except aiohttp.ClientError as e:
+                raise AcademicNetworkError(e) from e
+            except OSError as e:
+                raise AcademicDownloadError(f"File system error during download: {e}") from e
+            finally:
+                await _run_blocking(_discard, part)
+            return dest
+
+        return await self._retry_request(_do_download)
\ No newline at end of file
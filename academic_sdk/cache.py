@@ -0,0 +1,63 @@
+"""Response caching shared by the academic SDK clients: in-process and on-disk."""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def _cache_key(url: str, params: Dict[str, Any]) -> str:
+    """Stable, compact key for a request; blake2b is fast and collision-safe enough here."""
+    raw = repr((url, sorted(params.items()))).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def open_disk_cache(cache_dir: str):
+    """Open a ``diskcache.Cache`` in ``cache_dir``; diskcache is an optional dependency."""
+    try:
+        import diskcache
+    except ImportError as e:
+        raise ImportError("diskcache is required for response caching. Install with: pip install diskcache") from e
+    return diskcache.Cache(os.path.expanduser(cache_dir))
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion.
+
+    Holds at most ``maxsize`` entries; the least recently used one is evicted
+    first. Values are returned as stored, so callers should treat them as
+    read-only.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
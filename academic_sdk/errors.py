@@ -1,29 +1,41 @@
 """Shared error classes for academic SDKs."""
+from typing import Optional
 
 
 class AcademicSDKError(Exception):
-    """Base exception for academic SDK errors."""
-    pass
+    """Base exception for academic SDK errors.
+
+    Subclasses declare ``__slots__`` for the attributes they carry; instances
+    still get the ``__dict__`` that ``BaseException`` provides.
+    """
+    __slots__ = ()
 
 
 class AcademicAPIError(AcademicSDKError):
     """Raised when the API returns an error."""
-    def __init__(self, status: int, body: str = ""):
+    __slots__ = ("status", "body", "retry_after")
+
+    def __init__(self, status: int, body: str = "", retry_after: Optional[float] = None):
         self.status = status
         self.body = body
+        self.retry_after = retry_after
         super().__init__(f"API error {status}: {body}")
 
+    def __reduce__(self):
+        # slot values are not part of args, so rebuild from the constructor inputs
+        return (self.__class__, (self.status, self.body, self.retry_after))
+
 
 class AcademicNetworkError(AcademicSDKError):
     """Raised for network-related errors."""
-    pass
+    __slots__ = ()
 
 
 class AcademicParseError(AcademicSDKError):
     """Raised when parsing API responses fails."""
-    pass
+    __slots__ = ()
 
 
 class AcademicDownloadError(AcademicSDKError):
     """Raised for download-related errors."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -1,10 +1,18 @@
 """Shared models for academic SDKs."""
+import sys
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
+# Link and Author are the most numerous objects in a result set, so they are
+# validated dataclasses (slotted where supported) rather than full BaseModels.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class Link(BaseModel):
+
+@dataclass(frozen=True, config=ConfigDict(extra="ignore"), **_SLOTS)
+class Link:
     """A link associated with a paper."""
     href: str
     title: Optional[str] = None
@@ -12,14 +20,17 @@ class Link(BaseModel):
     type: Optional[str] = None
 
 
-class Author(BaseModel):
+@dataclass(frozen=True, config=ConfigDict(extra="ignore"), **_SLOTS)
+class Author:
     """An author of a paper."""
     name: str
     affiliations: Optional[List[str]] = None
 
 
 class Paper(BaseModel):
-    """Base model for a scholarly paper."""
+    """Base model for a scholarly paper. Instances are immutable once parsed."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     title: str
     summary: Optional[str] = None  # Abstract
@@ -39,4 +50,20 @@ class Paper(BaseModel):
     open_access_pdf: Optional[Dict[str, Any]] = None  # Semantic Scholar
     references: Optional[List[Dict[str, Any]]] = None  # Semantic Scholar
     citations: Optional[List[Dict[str, Any]]] = None  # Semantic Scholar
-    tldr: Optional[Dict[str, Any]] = None  # Semantic Scholar TL;DR
\ No newline at end of file
+    tldr: Optional[Dict[str, Any]] = None  # Semantic Scholar TL;DR
+
+    # Display strings, computed on first use; not serialized.
+    @cached_property
+    def authors_str(self) -> str:
+        """Author names joined with ", "."""
+        return ", ".join([a.name for a in self.authors])
+
+    @cached_property
+    def published_str(self) -> Optional[str]:
+        """``published`` as ``YYYY-MM-DD``, or None when unknown."""
+        return self.published.date().isoformat() if self.published else None
+
+    @cached_property
+    def updated_str(self) -> Optional[str]:
+        """``updated`` as ``YYYY-MM-DD``, or None when unknown."""
+        return self.updated.date().isoformat() if self.updated else None
@@ -0,0 +1,46 @@
+"""Token-bucket rate limiting shared by the sync and async clients."""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Token-bucket limiter usable from both sync and async code.
+
+    Allows bursts of up to ``capacity`` calls and refills continuously at
+    ``capacity`` tokens per ``period`` seconds. A non-positive ``period``
+    disables limiting. Callers reserve a token under a short lock and do any
+    waiting outside it, so waiters never serialize on each other's sleeps.
+    """
+
+    def __init__(self, capacity: float = 1, period: float = 3.0):
+        self.capacity = capacity
+        self.period = period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        if self.period <= 0:
+            return 0.0
+        rate = self.capacity / self.period
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            # a negative balance is a queue of already-promised future slots
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -3,6 +3,7 @@ from .query import QueryBuilder
 from .models import ArxivPaper, ArxivResultSet, Author, Link
 from .errors import ArxivSDKError, ArxivAPIError, ArxivNetworkError, ArxivParseError, ArxivDownloadError
 from .categories import Category
+from .loop import install_fast_loop
 from . import categories
 from .__version__ import __version__
 
@@ -20,5 +21,6 @@ __all__ = [
     "ArxivDownloadError",
     "categories",
     "Category",
+    "install_fast_loop",
     "__version__",
 ]
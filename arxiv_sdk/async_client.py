@@ -1,14 +1,17 @@
 """Async client for the arXiv API with rate limiting."""
 import asyncio
 import logging
-from typing import Optional, Union, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse, unquote
 import re
-import unicodedata
 import os
 
 import aiohttp
+from pydantic import ValidationError
 
+from academic_sdk.base_client import _discard, _retry_after_seconds, _run_blocking, _slugify_impl
+from academic_sdk.atom import parse_feed
+from academic_sdk.cache import _cache_key, open_disk_cache
 from academic_sdk.models import Paper, Author, Link
 from academic_sdk.errors import (
 
@@ -21,10 +24,17 @@ from academic_sdk.errors import (
     AcademicDownloadError as ArxivDownloadError,
 
 )
-from .models import ArxivPaper, ArxivResultSet
+from .models import PAPER_ADAPTER, PAPERS_ADAPTER, ArxivPaper, ArxivResultSet
+from .categories import _dirname_by_code
+from .client import _opensearch_int
 
 logger = logging.getLogger(__name__)
 
+_ID_FMT_RE = re.compile(r'\d{4}\.\d{5}(v\d+)?$')
+_CD_RE = re.compile(r"""filename\*=UTF-8''(.+)|filename="?([^";]+)"?""")
+_ABS_RE = re.compile(r"/abs/(.+)$")
+_VERSION_SUFFIX_RE = re.compile(r'v\d+$')
+
 
 def _async_default_user_agent(app_name="ArxivSDK"):
     # Similar to sync version, but async not needed here
@@ -42,29 +52,63 @@ def _async_default_user_agent(app_name="ArxivSDK"):
     return f"{app_name}/{ver}{contact}"
 
 
+def _parse_retry_after(headers) -> Optional[float]:
+    return _retry_after_seconds(headers.get('Retry-After'))
+
+
+def _slugify(text: str, maxlen: int = 80) -> str:
+    # one str.translate pass; shared (and cached) with the academic_sdk clients
+    if not text:
+        return ''
+    return _slugify_impl(text, maxlen)
+
+
 class AsyncArxivClient:
     """Async client for interacting with the arXiv Atom API.
 
     Includes rate limiting (1 req/3 sec) and retries for stability.
     """
     BASE_URL = "http://export.arxiv.org/api/query"
-
-    def __init__(self, base_url: Optional[str] = None, user_agent: Optional[str] = None, rate_limit: float = 3.0, max_concurrent: int = 1, session: Optional[aiohttp.ClientSession] = None):
+    MAX_IDS_PER_REQUEST = 200
+    CONNECTION_LIMIT = 32
+    CONNECTION_LIMIT_PER_HOST = 4
+    # interactive callers (the TUI) search minutes apart; keep the TLS
+    # connection around longer than aiohttp's 15s default
+    KEEPALIVE_TIMEOUT = 300
+
+    def __init__(self, base_url: Optional[str] = None, user_agent: Optional[str] = None, rate_limit: float = 3.0, max_concurrent: int = 1, session: Optional[aiohttp.ClientSession] = None,
+                 cache_dir: Optional[str] = None, cache_ttl: float = 3600.0):
         self.base_url = base_url or self.BASE_URL
         self.user_agent = user_agent or _async_default_user_agent()
         self.rate_limit = rate_limit  # seconds between requests
         self.max_concurrent = max_concurrent
-        self.session = session or aiohttp.ClientSession()
+        self.session = session or aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.CONNECTION_LIMIT,
+                limit_per_host=max(self.CONNECTION_LIMIT_PER_HOST, max_concurrent),
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            )
+        )
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.last_request_time = 0.0
+        self._rate_lock = asyncio.Lock()
+        # optional on-disk cache of parsed feeds, as in ArxivClient
+        self.cache_ttl = cache_ttl
+        self._cache = open_disk_cache(cache_dir) if cache_dir else None
 
     async def _apply_rate_limit(self):
-        """Apply rate limiting by sleeping if needed."""
-        now = asyncio.get_event_loop().time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.rate_limit:
-            await asyncio.sleep(self.rate_limit - elapsed)
-        self.last_request_time = asyncio.get_event_loop().time()
+        """Apply rate limiting by sleeping if needed.
+
+        Each caller reserves the next free slot under a lock and sleeps outside
+        it, so concurrent requests stay spaced ``rate_limit`` seconds apart.
+        """
+        async with self._rate_lock:
+            now = asyncio.get_running_loop().time()
+            next_slot = max(now, self.last_request_time + self.rate_limit)
+            self.last_request_time = next_slot
+        wait = next_slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
 
     async def _retry_request(self, request_func, max_retries=3):
         """Retry async requests with backoff."""
@@ -74,13 +118,47 @@ class AsyncArxivClient:
                 async with self.semaphore:
                     await self._apply_rate_limit()
                     return await request_func()
+            except ArxivAPIError as e:
+                # throttling and server errors are transient; anything else is final
+                if attempt == max_retries - 1 or not (e.status == 429 or e.status >= 500):
+                    raise
+                delay = e.retry_after if e.retry_after is not None else backoff
+                logger.warning("Async request failed (attempt %d/%d), retrying in %.1f seconds: %s", attempt + 1, max_retries, delay, e)
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, 30)
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 if attempt == max_retries - 1:
-                    raise ArxivNetworkError(e)
-                logger.warning("Async request failed (attempt %d/3), retrying in %d seconds: %s", attempt + 1, backoff, e)
+                    raise ArxivNetworkError(e) from e
+                logger.warning("Async request failed (attempt %d/%d), retrying in %.1f seconds: %s", attempt + 1, max_retries, backoff, e)
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, 30)
 
+    async def _fetch_feed(self, params: Dict[str, Any], timeout: float) -> Tuple[Dict[str, Any], List[Any]]:
+        """Send one rate-limited, retried API query and parse the Atom response.
+
+        With a ``cache_dir``, a fresh cached result for the same query is
+        returned instead.
+        """
+        key = None
+        if self._cache is not None:
+            # diskcache is SQLite-backed; keep its I/O off the event loop
+            key = _cache_key(self.base_url, params)
+            hit = await _run_blocking(self._cache.get, key)
+            if hit is not None:
+                return hit
+        headers = {"User-Agent": self.user_agent}
+
+        async def _do_request():
+            async with self.session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers) as resp:
+                if resp.status != 200:
+                    raise ArxivAPIError(resp.status, body=await resp.text(), retry_after=_parse_retry_after(resp.headers))
+                return parse_feed(await resp.read())
+
+        result = await self._retry_request(_do_request)
+        if key is not None:
+            await _run_blocking(self._cache.set, key, result, expire=self.cache_ttl)
+        return result
+
     async def search(self, query: Union[str, object], start: int = 0, max_results: int = 10, timeout: float = 10.0) -> ArxivResultSet:
         """Search arXiv asynchronously."""
         if isinstance(query, str):
@@ -113,79 +191,57 @@ class AsyncArxivClient:
         if sortOrder:
             params['sortOrder'] = sortOrder
 
-        headers = {"User-Agent": self.user_agent}
-
-        async def _do_request():
-            async with self.session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers) as resp:
-                if resp.status != 200:
-                    raise ArxivAPIError(resp.status, body=await resp.text())
-                import feedparser
-                feed = feedparser.parse(await resp.text())
-                if not hasattr(feed, 'entries'):
-                    raise ArxivParseError('No entries in feed')
-
-                # Parse metadata and entries (similar to sync version)
-                feed_meta = getattr(feed, 'feed', {})
-                total = None
-                start_index = None
-                items_per_page = None
-                try:
-                    total = int(feed_meta.get('opensearch_totalresults')) if feed_meta.get('opensearch_totalresults') is not None else None
-                except (ValueError, TypeError):
-                    logger.warning("Failed to parse opensearch_totalresults: %s", feed_meta.get('opensearch_totalresults'))
-                    total = None
+        meta, entries = await self._fetch_feed(params, timeout)
+        total = _opensearch_int(meta, 'total_results')
+        start_index = _opensearch_int(meta, 'start_index')
+        items_per_page = _opensearch_int(meta, 'items_per_page')
+
+        try:
+            # one pydantic-core call for the whole page in the common case
+            papers = PAPERS_ADAPTER.validate_python(entries)
+        except ValidationError:
+            # re-validate entry by entry only to report which ones failed
+            parse_errors = []
+            for idx, entry in enumerate(entries):
                 try:
-                    start_index = int(feed_meta.get('opensearch_startindex')) if feed_meta.get('opensearch_startindex') is not None else None
-                except (ValueError, TypeError):
-                    logger.warning("Failed to parse opensearch_startindex: %s", feed_meta.get('opensearch_startindex'))
-                    start_index = None
-                try:
-                    items_per_page = int(feed_meta.get('opensearch_itemsperpage')) if feed_meta.get('opensearch_itemsperpage') is not None else None
-                except (ValueError, TypeError):
-                    logger.warning("Failed to parse opensearch_itemsperpage: %s", feed_meta.get('opensearch_itemsperpage'))
-                    items_per_page = None
-
-                papers = []
-                parse_errors = []
-                for idx, entry in enumerate(feed.entries):
-                    try:
-                        paper = ArxivPaper.model_validate(entry)
-                        papers.append(paper)
-                    except (ValueError, TypeError) as e:
-                        logger.warning("Failed to parse entry at index %d: %s", idx, e)
-                        parse_errors.append({'index': idx, 'error': str(e)})
-
-                if parse_errors:
-                    first = parse_errors[0]
-                    raise ArxivParseError(f"{len(parse_errors)} entries failed to parse (first at index {first['index']}): {first['error']}")
-
-                result = ArxivResultSet(entries=papers, total_results=total, start_index=start_index, items_per_page=items_per_page, query=search_query, sortBy=sortBy, sortOrder=sortOrder)
-                return result
+                    PAPER_ADAPTER.validate_python(entry)
+                except (ValueError, TypeError) as e:
+                    logger.warning("Failed to parse entry at index %d: %s", idx, e)
+                    parse_errors.append({'index': idx, 'error': str(e)})
+            first = parse_errors[0]
+            raise ArxivParseError(f"{len(parse_errors)} entries failed to parse (first at index {first['index']}): {first['error']}")
 
-        return await self._retry_request(_do_request)
+        return ArxivResultSet(entries=papers, total_results=total, start_index=start_index, items_per_page=items_per_page, query=search_query, sortBy=sortBy, sortOrder=sortOrder)
 
     async def get_by_id(self, arxiv_id: str, timeout: float = 10.0) -> Optional[ArxivPaper]:
         """Get paper by ID asynchronously."""
-        if not re.match(r'\d{4}\.\d{5}(v\d+)?$', arxiv_id):
-            raise ValueError("Invalid arXiv ID format")
-        params = {"id_list": arxiv_id, "start": 0, "max_results": 1}
-        headers = {"User-Agent": self.user_agent}
-
-        async def _do_request():
-            async with self.session.get(self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers) as resp:
-                if resp.status != 200:
-                    raise ArxivAPIError(resp.status, body=await resp.text())
-                import feedparser
-                feed = feedparser.parse(await resp.text())
-                if not feed.entries:
-                    return None
-                try:
-                    entry = feed.entries[0]
-                    return ArxivPaper.model_validate(entry)
-                except (ValueError, TypeError) as e:
-                    raise ArxivParseError(e)
+        return (await self.get_many_by_id([arxiv_id], timeout=timeout))[0]
+
+    async def get_many_by_id(self, arxiv_ids: List[str], timeout: float = 10.0) -> List[Optional[ArxivPaper]]:
+        """Get several papers with one ``id_list`` request per ``MAX_IDS_PER_REQUEST`` IDs.
+
+        Results follow the order of ``arxiv_ids``; IDs arXiv does not return map
+        to ``None``. An unversioned ID matches whichever version arXiv returns.
+        """
+        for arxiv_id in arxiv_ids:
+            if not _ID_FMT_RE.match(arxiv_id):
+                raise ValueError(f"Invalid arXiv ID format: {arxiv_id}")
+        found = {}
+
+        for i in range(0, len(arxiv_ids), self.MAX_IDS_PER_REQUEST):
+            chunk = arxiv_ids[i:i + self.MAX_IDS_PER_REQUEST]
+            params = {"id_list": ",".join(chunk), "start": 0, "max_results": len(chunk)}
+            _, entries = await self._fetch_feed(params, timeout)
+            try:
+                papers = PAPERS_ADAPTER.validate_python(entries)
+            except (ValueError, TypeError) as e:
+                raise ArxivParseError(e) from e
+            for paper in papers:
+                versioned = paper.id.rsplit('/abs/', 1)[-1]
+                found[versioned] = paper
+                found.setdefault(_VERSION_SUFFIX_RE.sub('', versioned), paper)
 
-        return await self._retry_request(_do_request)
+        return [found.get(arxiv_id) for arxiv_id in arxiv_ids]
 
     async def download_pdf(self, paper: ArxivPaper, dest_path: str, timeout: float = 20.0, overwrite: bool = False) -> str:
         """Download PDF asynchronously."""
@@ -202,33 +258,20 @@ class AsyncArxivClient:
                 filename = None
                 cd = r.headers.get('content-disposition')
                 if cd:
-                    m = re.search(r'filename\*=UTF-8''(.+)|filename="?([^";]+)"?', cd)
+                    m = _CD_RE.search(cd)
                     if m:
                         filename = unquote(m.group(1) or m.group(2))
                 if not filename:
                     parsed = urlparse(r.url)
                     filename = os.path.basename(parsed.path)
 
-                # Slugify logic (same as sync)
-                def _slugify(text: str, maxlen: int = 80) -> str:
-                    if not text:
-                        return ''
-                    text = unicodedata.normalize('NFKD', text)
-                    text = text.encode('ascii', 'ignore').decode('ascii')
-                    text = text.lower()
-                    text = re.sub(r"[^a-z0-9]+", '_', text)
-                    text = text.strip('_')
-                    if len(text) > maxlen:
-                        text = text[:maxlen].rstrip('_')
-                    return text or ''
-
                 title_slug = _slugify(getattr(paper, 'title', '') or '')
                 if not title_slug:
                     title_slug = os.path.splitext(filename)[0]
 
                 arxiv_id = None
                 try:
-                    m_id = re.search(r"/abs/(.+)$", getattr(paper, 'id', '') or '')
+                    m_id = _ABS_RE.search(getattr(paper, 'id', '') or '')
                     if m_id:
                         arxiv_id = m_id.group(1)
                 except (TypeError, AttributeError) as e:
@@ -239,14 +282,14 @@ class AsyncArxivClient:
                 else:
                     final_name = f"{title_slug}.pdf"
 
-                if not os.path.isdir(dest_path):
+                if not await _run_blocking(os.path.isdir, dest_path):
                     raise ArxivDownloadError(f"Destination path does not exist: {dest_path}")
 
                 # Category subfolder
                 cat = getattr(paper, 'primary_category', None)
                 if cat:
                     try:
-                        cat_name = str(cat).replace('.', '_').upper()
+                        cat_name = _dirname_by_code().get(cat) or str(cat).replace('.', '_').upper()
                         if not cat_name:
                             cat_name = 'UNKNOWN'
                     except (AttributeError, TypeError) as e:
@@ -257,12 +300,12 @@ class AsyncArxivClient:
 
                 category_dir = os.path.join(dest_path, cat_name)
                 try:
-                    os.makedirs(category_dir, exist_ok=True)
+                    await _run_blocking(os.makedirs, category_dir, exist_ok=True)
                 except OSError as e:
-                    raise ArxivDownloadError(f"Failed to create category directory {category_dir}: {e}")
+                    raise ArxivDownloadError(f"Failed to create category directory {category_dir}: {e}") from e
 
                 full = os.path.join(category_dir, final_name)
-                if os.path.exists(full) and not overwrite:
+                if not overwrite and await _run_blocking(os.path.exists, full):
                     return full
 
                 try:
@@ -274,25 +317,45 @@ class AsyncArxivClient:
                                 bytes_written += len(chunk)
                     # Validation
                     if bytes_written == 0:
-                        os.remove(full)
+                        await _run_blocking(_discard, full)
                         raise ArxivDownloadError("Downloaded file is empty")
 
-                    # Save paper metadata as JSON
-                    json_path = full.replace('.pdf', '.json')
+                    # Save paper metadata as JSON; pydantic-core serializes straight to bytes
+                    json_path = os.path.splitext(full)[0] + '.json'
                     try:
-                        with open(json_path, 'w', encoding='utf-8') as jf:
-                            jf.write(paper.model_dump_json(indent=2))
+                        with open(json_path, 'wb') as jf:
+                            jf.write(paper.__pydantic_serializer__.to_json(paper, indent=2))
                     except Exception as e:
                         logger.warning("Failed to save metadata JSON for %s: %s", full, e)
                         # Don't fail the download for this
                 except OSError as e:
-                    if os.path.exists(full):
-                        os.remove(full)
-                    raise ArxivDownloadError(f"File system error during download: {e}")
+                    await _run_blocking(_discard, full)
+                    raise ArxivDownloadError(f"File system error during download: {e}") from e
                 return full
 
         return await self._retry_request(_do_request)
 
+    async def download_many(self, papers: List[ArxivPaper], dest_path: str, timeout: float = 20.0, overwrite: bool = False, return_exceptions: bool = False) -> List[Union[str, BaseException]]:
+        """Download PDFs for several papers concurrently.
+
+        Transfers overlap up to ``max_concurrent`` while still respecting the
+        rate limit. Returns the local paths in the same order as ``papers``.
+        With ``return_exceptions=True`` a failed download leaves its exception
+        in that slot instead of aborting the whole batch.
+        """
+        return list(await asyncio.gather(
+            *(self.download_pdf(p, dest_path, timeout=timeout, overwrite=overwrite) for p in papers),
+            return_exceptions=return_exceptions,
+        ))
+
     async def close(self):
-        """Close the session."""
-        await self.session.close()
\ No newline at end of file
+        """Close the session and the response cache, if any."""
+        await self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    async def __aenter__(self) -> "AsyncArxivClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
\ No newline at end of file
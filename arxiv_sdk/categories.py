@@ -9,11 +9,9 @@ Use like:
 The Enum values are the standard arXiv category codes (e.g. ``cs.LG``).
 This file is intentionally a compact, curated list — extend as needed.
 """
-import logging
+import functools
 from enum import Enum
 
-logger = logging.getLogger(__name__)
-
 
 class Category(str, Enum):
     # Computer Science
@@ -289,23 +287,33 @@ CATEGORY_DESCRIPTIONS: dict[Category, str] = {
 }
 
 
+# Derived lookup tables are built on first use so importing the package (e.g.
+# just for ``Category``) does not pay for them.
+@functools.lru_cache(maxsize=None)
+def _desc_by_code() -> dict[str, str]:
+    """String-keyed view so lookups by code skip the Enum round-trip."""
+    return {cat.value: desc for cat, desc in CATEGORY_DESCRIPTIONS.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _dirname_by_code() -> dict[str, str]:
+    """Download sub-directory name for each category code, e.g. ``cs.LG`` -> ``CS_LG``."""
+    return {c.value: c.value.replace('.', '_').upper() for c in Category}
+
+
+@functools.lru_cache(maxsize=None)
+def _search_index() -> tuple[tuple[str, str, str, str], ...]:
+    """(code, description, code_lower, description_lower) rows for search_categories."""
+    return tuple((code, desc, code.lower(), desc.lower()) for code, desc in _desc_by_code().items())
+
+
 def load_full_taxonomy() -> dict[str, str]:
-    """Load full arXiv category taxonomy from the official page.
+    """Return the arXiv category taxonomy as a dict of code to description.
 
-    Returns a dict of category code to description.
-    Falls back to built-in descriptions if fetch fails.
+    This is served from the built-in descriptions; it does not touch the
+    network. A fresh copy is returned so callers may mutate it.
     """
-    try:
-        import requests
-        resp = requests.get("https://arxiv.org/category_taxonomy", timeout=10)
-        resp.raise_for_status()
-        # Parse HTML for categories (simplified; in practice, use BeautifulSoup)
-        # For now, return built-in
-        logger.warning("Full taxonomy loading not implemented; using built-in")
-        return {cat.value: desc for cat, desc in CATEGORY_DESCRIPTIONS.items()}
-    except Exception as e:
-        logger.warning("Failed to load full taxonomy: %s", e)
-        return {cat.value: desc for cat, desc in CATEGORY_DESCRIPTIONS.items()}
+    return dict(_desc_by_code())
 
 
 def search_categories(query: str) -> list[tuple[str, str]]:
@@ -314,11 +322,11 @@ def search_categories(query: str) -> list[tuple[str, str]]:
     Returns list of (code, description) tuples.
     """
     query_lower = query.lower()
-    results = []
-    for cat, desc in CATEGORY_DESCRIPTIONS.items():
-        if query_lower in cat.value.lower() or query_lower in desc.lower():
-            results.append((cat.value, desc))
-    return results
+    return [
+        (code, desc)
+        for code, desc, code_lower, desc_lower in _search_index()
+        if query_lower in code_lower or query_lower in desc_lower
+    ]
 
 
 def get_category_description(cat: Category | str) -> str | None:
@@ -326,11 +334,6 @@ def get_category_description(cat: Category | str) -> str | None:
 
     Returns None when no description is available.
     """
-    if isinstance(cat, str):
-        # try to map string to enum
-        try:
-            cat = Category(cat)
-        except ValueError as e:
-            logger.warning("Invalid category: %s", e)
-            return None
-    return CATEGORY_DESCRIPTIONS.get(cat)
+    if isinstance(cat, Category):
+        return _desc_by_code().get(cat.value)
+    return _desc_by_code().get(cat)
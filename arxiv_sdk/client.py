@@ -1,22 +1,37 @@
 from __future__ import annotations
-from typing import Optional, Union, List
-import time
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import os
+import shutil
 import logging
 from urllib.parse import urlparse, unquote
 import importlib.metadata
 import re
-import unicodedata
 
 import requests
-import feedparser
-
+import urllib3
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from academic_sdk.atom import AtomStreamParser
+from academic_sdk.errors import AcademicParseError
+from academic_sdk.base_client import _slugify_impl
+from academic_sdk.cache import _cache_key, open_disk_cache
 from academic_sdk.models import Paper
-from academic_sdk.errors import AcademicAPIError, AcademicNetworkError, AcademicParseError, AcademicDownloadError
-from .models import ArxivPaper, ArxivResultSet
+from academic_sdk.ratelimit import TokenBucket
+from .errors import ArxivAPIError, ArxivNetworkError, ArxivParseError, ArxivDownloadError
+from .models import PAPER_ADAPTER, PAPERS_ADAPTER, ArxivPaper, ArxivResultSet
+from .categories import _dirname_by_code
 
 logger = logging.getLogger(__name__)
 
+_FEED_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+_ID_FMT_RE = re.compile(r'\d{4}\.\d{5}(v\d+)?$')
+_CD_RE = re.compile(r"""filename\*=UTF-8''(.+)|filename="?([^";]+)"?""")
+_ABS_RE = re.compile(r"/abs/(.+)$")
+_VERSION_SUFFIX_RE = re.compile(r'v\d+$')
+
 
 def _default_user_agent(app_name="ArxivSDK"):
     env = os.environ.get("ARXIV_SDK_USER_AGENT")
@@ -32,6 +47,24 @@ def _default_user_agent(app_name="ArxivSDK"):
     return f"{app_name}/{ver}{contact}"
 
 
+def _slugify(text: str, maxlen: int = 80) -> str:
+    # one str.translate pass; shared (and cached) with the academic_sdk clients
+    if not text:
+        return ''
+    return _slugify_impl(text, maxlen)
+
+
+def _opensearch_int(meta: Dict[str, Any], key: str) -> Optional[int]:
+    value = meta.get(key)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        logger.warning("Failed to parse %s: %s", key, value)
+        return None
+
+
 class ArxivClient:
     """Client for interacting with the arXiv Atom API.
 
@@ -39,24 +72,137 @@ class ArxivClient:
     Handles retries, rate limiting, and error handling for stability.
     """
     BASE_URL = "http://export.arxiv.org/api/query"
+    MAX_IDS_PER_REQUEST = 200
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
 
-    def __init__(self, base_url: Optional[str] = None, session: Optional[requests.Session] = None, user_agent: Optional[str] = None, rate_limit: Optional[float] = None):
+    def __init__(self, base_url: Optional[str] = None, session: Optional[requests.Session] = None, user_agent: Optional[str] = None, rate_limit: Optional[float] = None, use_lxml: bool = True, rate_limit_burst: int = 1, pdf_cache_dir: Optional[str] = None,
+                 save_metadata: bool = True, pretty_json: bool = False, cache_dir: Optional[str] = None, cache_ttl: float = 3600.0):
         """Initialize the client.
 
         Args:
             base_url: Custom base URL for the API.
-            session: Custom requests session.
+            session: Custom requests session. It is used as-is; the default
+                session gets a pooled adapter that retries transient failures.
             user_agent: Custom user agent string.
-            rate_limit: Delay in seconds between requests.
+            rate_limit: Minimum average delay in seconds between requests.
+            use_lxml: Parse feeds with lxml; set False to fall back to feedparser.
+            rate_limit_burst: Requests allowed back-to-back after an idle period.
+            pdf_cache_dir: Directory of previously downloaded PDFs keyed by arXiv
+                id (e.g. ``~/.cache/arxiv_sdk``). Cached copies are hard-linked
+                (or copied) into the destination instead of downloaded again.
+            save_metadata: Write a ``.json`` metadata file next to each PDF.
+            pretty_json: Indent the metadata JSON for human readers.
+            cache_dir: Directory for an on-disk cache of parsed feeds (needs
+                ``diskcache``). Repeated searches and ID lookups within
+                ``cache_ttl`` seconds are answered without a request.
+            cache_ttl: Lifetime of cached feeds in seconds.
         """
         self.base_url = base_url or self.BASE_URL
-        self.session = session or requests.Session()
         self.user_agent = user_agent or _default_user_agent()
+        if session is None:
+            # our own session carries the header; a caller's session is left alone
+            # and gets it per request instead
+            session = self._build_session()
+            session.headers.update({"User-Agent": self.user_agent})
+            self._request_headers = None
+        else:
+            self._request_headers = {"User-Agent": self.user_agent}
+        self.session = session
         self.rate_limit = rate_limit
+        self.use_lxml = use_lxml
+        self._created_dirs: Set[str] = set()
+        self.save_metadata = save_metadata
+        self.pretty_json = pretty_json
+        self.pdf_cache_dir = os.path.expanduser(pdf_cache_dir) if pdf_cache_dir else None
+        if self.pdf_cache_dir:
+            os.makedirs(self.pdf_cache_dir, exist_ok=True)
+        burst = max(1, int(rate_limit_burst))
+        # refills one token every rate_limit seconds; no limit when rate_limit is unset
+        self._bucket = TokenBucket(burst, (rate_limit or 0) * burst)
+        self.cache_ttl = cache_ttl
+        self._cache = open_disk_cache(cache_dir) if cache_dir else None
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        # Three attempts in total: urllib3 retries the first failure immediately,
+        # then waits 2s before the last attempt. 429/5xx responses are
+        # retried too (honouring Retry-After); once exhausted the last response
+        # is returned so the usual status check reports it.
+        retry = Retry(
+            total=2,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def _apply_rate_limit(self):
-        if self.rate_limit:
-            time.sleep(self.rate_limit)
+        self._bucket.acquire()
+
+    def _parse_feed(self, resp) -> Tuple[Dict[str, Any], List[Any]]:
+        """Return ``(opensearch_meta, entries)`` for an Atom response."""
+        if self.use_lxml:
+            # feed the parser as bytes arrive instead of buffering the whole body
+            parser = AtomStreamParser()
+            try:
+                for chunk in resp.iter_content(chunk_size=_FEED_CHUNK_SIZE):
+                    parser.feed(chunk)
+                parser.close()
+                return parser.meta, parser.entries
+            except AcademicParseError as e:
+                raise ArxivParseError(str(e)) from e
+            except requests.RequestException as e:
+                # the body is read lazily, so connection drops surface here
+                raise ArxivNetworkError(e) from e
+        import feedparser
+        feed = feedparser.parse(resp.text)
+        if not hasattr(feed, 'entries'):
+            raise ArxivParseError('No entries in feed')
+        # OpenSearch metadata lives in feed.feed
+        feed_meta = getattr(feed, 'feed', {})
+        meta = {
+            'total_results': feed_meta.get('opensearch_totalresults'),
+            'start_index': feed_meta.get('opensearch_startindex'),
+            'items_per_page': feed_meta.get('opensearch_itemsperpage'),
+        }
+        return meta, feed.entries
+
+    def _fetch_feed(self, params: Union[Dict[str, Any], List[Tuple[str, Any]]], timeout: float) -> Tuple[Dict[str, Any], List[Any]]:
+        """Send one rate-limited API query and parse the Atom response.
+
+        With a ``cache_dir``, a fresh cached result for the same query is
+        returned instead, without spending a rate-limit token.
+        """
+        key = None
+        if self._cache is not None:
+            key = _cache_key(self.base_url, dict(params))
+            hit = self._cache.get(key)
+            if hit is not None:
+                return hit
+        result = self._request_feed(params, timeout)
+        if key is not None:
+            self._cache.set(key, result, expire=self.cache_ttl)
+        return result
+
+    def _request_feed(self, params: Union[Dict[str, Any], List[Tuple[str, Any]]], timeout: float) -> Tuple[Dict[str, Any], List[Any]]:
+        self._apply_rate_limit()
+        # transient failures are retried by the session's urllib3 Retry policy
+        try:
+            resp = self.session.get(self.base_url, params=params, timeout=timeout, stream=True, headers=self._request_headers)
+        except requests.RequestException as e:
+            raise ArxivNetworkError(e) from e
+        try:
+            if resp.status_code != 200:
+                raise ArxivAPIError(resp.status_code, body=resp.text)
+            return self._parse_feed(resp)
+        finally:
+            resp.close()
 
     def search(self, query: Union[str, object], start: int = 0, max_results: int = 10, timeout: float = 10.0) -> ArxivResultSet:
         if isinstance(query, str):
@@ -81,72 +227,30 @@ class ArxivClient:
             # respect recommended slice limit; allow but warn or cap — here we cap
             raise ValueError("max_results must be <= 2000 per request; page large sets in slices")
 
-        params = {
-            "search_query": search_query,
-            "start": start,
-            "max_results": max_results,
-        }
+        params = [("search_query", search_query), ("start", start), ("max_results", max_results)]
         if sortBy:
-            params['sortBy'] = sortBy
+            params.append(("sortBy", sortBy))
         if sortOrder:
-            params['sortOrder'] = sortOrder
+            params.append(("sortOrder", sortOrder))
 
-        headers = {"User-Agent": self.user_agent}
+        meta, entries = self._fetch_feed(params, timeout)
+        total = _opensearch_int(meta, 'total_results')
+        start_index = _opensearch_int(meta, 'start_index')
+        items_per_page = _opensearch_int(meta, 'items_per_page')
 
-        self._apply_rate_limit()
-
-        for attempt in range(3):
-            try:
-                resp = self.session.get(self.base_url, params=params, timeout=timeout, headers=headers)
-                break
-            except requests.RequestException as e:
-                if attempt == 2:
-                    raise ArxivNetworkError(e)
-                backoff = 2 ** attempt
-                logger.warning("Search request failed (attempt %d/3), retrying in %d seconds: %s", attempt + 1, backoff, e)
-                time.sleep(backoff)
-
-        if resp.status_code != 200:
-            raise ArxivAPIError(resp.status_code, body=resp.text)
-
-        feed = feedparser.parse(resp.text)
-        if not hasattr(feed, 'entries'):
-            raise ArxivParseError('No entries in feed')
-
-        # OpenSearch metadata lives in feed.feed
-        feed_meta = getattr(feed, 'feed', {})
-        total = None
-        start_index = None
-        items_per_page = None
-        try:
-            total = int(feed_meta.get('opensearch_totalresults')) if feed_meta.get('opensearch_totalresults') is not None else None
-        except (ValueError, TypeError):
-            logger.warning("Failed to parse opensearch_totalresults: %s", feed_meta.get('opensearch_totalresults'))
-            total = None
-        try:
-            start_index = int(feed_meta.get('opensearch_startindex')) if feed_meta.get('opensearch_startindex') is not None else None
-        except (ValueError, TypeError):
-            logger.warning("Failed to parse opensearch_startindex: %s", feed_meta.get('opensearch_startindex'))
-            start_index = None
         try:
-            items_per_page = int(feed_meta.get('opensearch_itemsperpage')) if feed_meta.get('opensearch_itemsperpage') is not None else None
-        except (ValueError, TypeError):
-            logger.warning("Failed to parse opensearch_itemsperpage: %s", feed_meta.get('opensearch_itemsperpage'))
-            items_per_page = None
-
-        papers: List[ArxivPaper] = []
-        parse_errors = []
-        for idx, entry in enumerate(feed.entries):
-            # feedparser entries are dict-like
-            try:
-                # normalize entry fields for Pydantic; leave extra ignored
-                papers.append(ArxivPaper.model_validate(entry))
-            except (ValueError, TypeError) as e:
-                # collect parse errors to surface a helpful message
-                logger.warning("Failed to parse entry at index %d: %s", idx, e)
-                parse_errors.append({'index': idx, 'error': str(e)})
-
-        if parse_errors:
+            # one pydantic-core call for the whole page in the common case
+            papers: List[ArxivPaper] = PAPERS_ADAPTER.validate_python(entries)
+        except ValidationError:
+            # re-validate entry by entry only to report which ones failed
+            parse_errors = []
+            for idx, entry in enumerate(entries):
+                try:
+                    PAPER_ADAPTER.validate_python(entry)
+                except (ValueError, TypeError) as e:
+                    # collect parse errors to surface a helpful message
+                    logger.warning("Failed to parse entry at index %d: %s", idx, e)
+                    parse_errors.append({'index': idx, 'error': str(e)})
             # surface a clear parse error with a short summary
             first = parse_errors[0]
             raise ArxivParseError(f"{len(parse_errors)} entries failed to parse (first at index {first['index']}): {first['error']}")
@@ -155,136 +259,192 @@ class ArxivClient:
         return result
 
     def get_by_id(self, arxiv_id: str, timeout: float = 10.0) -> Optional[ArxivPaper]:
-        if not re.match(r'\d{4}\.\d{5}(v\d+)?$', arxiv_id):
-            raise ValueError("Invalid arXiv ID format")
-        params = {"id_list": arxiv_id, "start": 0, "max_results": 1}
-        headers = {"User-Agent": self.user_agent}
-        self._apply_rate_limit()
-        for attempt in range(3):
+        return self.get_many_by_id([arxiv_id], timeout=timeout)[0]
+
+    def get_many_by_id(self, arxiv_ids: List[str], timeout: float = 10.0) -> List[Optional[ArxivPaper]]:
+        """Get several papers with one ``id_list`` request per ``MAX_IDS_PER_REQUEST`` IDs.
+
+        Results follow the order of ``arxiv_ids``; IDs arXiv does not return map
+        to ``None``. An unversioned ID matches whichever version arXiv returns.
+        """
+        for arxiv_id in arxiv_ids:
+            if not _ID_FMT_RE.match(arxiv_id):
+                raise ValueError(f"Invalid arXiv ID format: {arxiv_id}")
+        found: Dict[str, ArxivPaper] = {}
+        for i in range(0, len(arxiv_ids), self.MAX_IDS_PER_REQUEST):
+            chunk = arxiv_ids[i:i + self.MAX_IDS_PER_REQUEST]
+            params = {"id_list": ",".join(chunk), "start": 0, "max_results": len(chunk)}
+            _, entries = self._fetch_feed(params, timeout)
             try:
-                resp = self.session.get(self.base_url, params=params, timeout=timeout, headers=headers)
-                break
-            except requests.RequestException as e:
-                if attempt == 2:
-                    raise ArxivNetworkError(e)
-                backoff = 2 ** attempt
-                logger.warning("Get by ID request failed (attempt %d/3), retrying in %d seconds: %s", attempt + 1, backoff, e)
-                time.sleep(backoff)
-        if resp.status_code != 200:
-            raise ArxivAPIError(resp.status_code, body=resp.text)
-        feed = feedparser.parse(resp.text)
-        if not feed.entries:
+                papers = PAPERS_ADAPTER.validate_python(entries)
+            except ValidationError as e:
+                raise ArxivParseError(e) from e
+            for paper in papers:
+                versioned = paper.id.rsplit('/abs/', 1)[-1]
+                found[versioned] = paper
+                found.setdefault(_VERSION_SUFFIX_RE.sub('', versioned), paper)
+        return [found.get(arxiv_id) for arxiv_id in arxiv_ids]
+
+    def _ensure_dir(self, path: str) -> None:
+        # makedirs costs a stat per call even when the directory already exists
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str) -> None:
+        # hard links cost no space; fall back to a copy across filesystems
+        part = dst + '.part'
+        try:
+            os.link(src, part)
+        except OSError:
+            shutil.copyfile(src, part)
+        os.replace(part, dst)
+
+    def _cached_pdf(self, arxiv_id: Optional[str]) -> Optional[str]:
+        if not self.pdf_cache_dir or not arxiv_id:
             return None
+        # old-style ids contain a slash (hep-ex/0307015v1)
+        return os.path.join(self.pdf_cache_dir, arxiv_id.replace('/', '_') + '.pdf')
+
+    def _write_metadata(self, paper: ArxivPaper, full: str) -> None:
+        if not self.save_metadata:
+            return
+        # Save paper metadata as JSON; pydantic-core serializes straight to bytes
+        json_path = os.path.splitext(full)[0] + '.json'
         try:
-            entry = feed.entries[0]
-            return ArxivPaper.model_validate(entry)
+            with open(json_path, 'wb') as jf:
+                jf.write(paper.__pydantic_serializer__.to_json(paper, indent=2 if self.pretty_json else None))
         except Exception as e:
-            raise ArxivParseError(e)
+            logger.warning("Failed to save metadata JSON for %s: %s", full, e)
+            # Don't fail the download for this
 
     def download_pdf(self, paper: ArxivPaper, dest_path: str, timeout: float = 20.0, overwrite: bool = False) -> str:
         url = paper.pdf_url
         if not url:
             raise ArxivDownloadError('No PDF URL available for this paper')
-        self._apply_rate_limit()
-        for attempt in range(3):
+
+        # require the hub dest_path to already exist and be a directory
+        if not os.path.isdir(dest_path):
+            raise ArxivDownloadError(f"Destination path does not exist: {dest_path}")
+
+        # Build a readable, unique filename: title_slug-arxivid.pdf
+        # Extract arXiv id from paper.id if available
+        arxiv_id = None
+        try:
+            m_id = _ABS_RE.search(getattr(paper, 'id', '') or '')
+            if m_id:
+                arxiv_id = m_id.group(1)
+        except (TypeError, AttributeError) as e:
+            logger.warning("Failed to extract arxiv_id: %s", e)
+            arxiv_id = None
+        suffix = f"-{arxiv_id}.pdf" if arxiv_id else ".pdf"
+        title_slug = _slugify(getattr(paper, 'title', '') or '')
+
+        # create a category subfolder under the hub (e.g. CS_LG)
+        cat = getattr(paper, 'primary_category', None)
+        if cat:
             try:
-                with self.session.get(url, stream=True, timeout=timeout, headers={"User-Agent": self.user_agent}) as r:
-                    r.raise_for_status()
-                    # try content-disposition
+                cat_name = _dirname_by_code().get(cat) or str(cat).replace('.', '_').upper()
+                if not cat_name:
+                    cat_name = 'UNKNOWN'
+            except (AttributeError, TypeError) as e:
+                logger.warning("Failed to normalize category: %s", e)
+                cat_name = 'UNKNOWN'
+        else:
+            cat_name = 'UNKNOWN'
+
+        category_dir = os.path.join(dest_path, cat_name)
+        try:
+            self._ensure_dir(category_dir)
+        except OSError as e:
+            raise ArxivDownloadError(f"Failed to create category directory {category_dir}: {e}") from e
+
+        if title_slug and not overwrite:
+            # the name is known up front, so an existing copy needs no request at all
+            full = os.path.join(category_dir, title_slug + suffix)
+            try:
+                os.stat(full)
+                return full
+            except FileNotFoundError:
+                pass
+
+        cached = self._cached_pdf(arxiv_id)
+        # overwrite also bypasses the cache, so a bad cached copy gets replaced below
+        if cached and title_slug and not overwrite:
+            try:
+                if os.stat(cached).st_size > 0:
+                    full = os.path.join(category_dir, title_slug + suffix)
+                    self._link_or_copy(cached, full)
+                    self._write_metadata(paper, full)
+                    return full
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Failed to reuse cached PDF %s: %s", cached, e)
+
+        self._apply_rate_limit()
+        try:
+            with self.session.get(url, stream=True, timeout=timeout, headers=self._request_headers) as r:
+                r.raise_for_status()
+                if title_slug:
+                    full = os.path.join(category_dir, title_slug + suffix)
+                else:
+                    # no usable title: name the file after the server's filename
                     filename = None
                     cd = r.headers.get('content-disposition')
                     if cd:
-                        m = re.search(r'filename\*=UTF-8''(.+)|filename="?([^";]+)"?', cd)
+                        m = _CD_RE.search(cd)
                         if m:
                             filename = unquote(m.group(1) or m.group(2))
                     if not filename:
                         parsed = urlparse(r.url)
                         filename = os.path.basename(parsed.path)
-                    # Build a readable, unique filename: title_slug-arxivid.pdf
-                    # Extract arXiv id from paper.id if available
-                    arxiv_id = None
-                    try:
-                        m_id = re.search(r"/abs/(.+)$", getattr(paper, 'id', '') or '')
-                        if m_id:
-                            arxiv_id = m_id.group(1)
-                    except (TypeError, AttributeError) as e:
-                        logger.warning("Failed to extract arxiv_id: %s", e)
-                        arxiv_id = None
-
-                    def _slugify(text: str, maxlen: int = 80) -> str:
-                        if not text:
-                            return ''
-                        text = unicodedata.normalize('NFKD', text)
-                        text = text.encode('ascii', 'ignore').decode('ascii')
-                        text = text.lower()
-                        text = re.sub(r"[^a-z0-9]+", '_', text)
-                        text = text.strip('_')
-                        if len(text) > maxlen:
-                            text = text[:maxlen].rstrip('_')
-                        return text or ''
-
-                    title_slug = _slugify(getattr(paper, 'title', '') or '')
-                    if not title_slug:
-                        title_slug = os.path.splitext(filename)[0]
-
-                    if arxiv_id:
-                        final_name = f"{title_slug}-{arxiv_id}.pdf"
-                    else:
-                        final_name = f"{title_slug}.pdf"
-
-                    # require the hub dest_path to already exist and be a directory
-                    if not os.path.isdir(dest_path):
-                        raise ArxivDownloadError(f"Destination path does not exist: {dest_path}")
-
-                    # create a category subfolder under the hub (e.g. CS_LG)
-                    cat = getattr(paper, 'primary_category', None)
-                    if cat:
+                    full = os.path.join(category_dir, os.path.splitext(filename)[0] + suffix)
+                    if not overwrite:
                         try:
-                            cat_name = str(cat).replace('.', '_').upper()
-                            if not cat_name:
-                                cat_name = 'UNKNOWN'
-                        except (AttributeError, TypeError) as e:
-                            logger.warning("Failed to normalize category: %s", e)
-                            cat_name = 'UNKNOWN'
-                    else:
-                        cat_name = 'UNKNOWN'
-
-                    category_dir = os.path.join(dest_path, cat_name)
-                    try:
-                        os.makedirs(category_dir, exist_ok=True)
-                    except OSError as e:
-                        raise ArxivDownloadError(f"Failed to create category directory {category_dir}: {e}")
-
-                    full = os.path.join(category_dir, final_name)
-                    if os.path.exists(full) and not overwrite:
-                        return full
+                            os.stat(full)
+                            return full
+                        except FileNotFoundError:
+                            pass
+
+                # write to a sibling .part file so an interrupted transfer never
+                # leaves a truncated PDF that a later call would treat as done
+                part = full + '.part'
+                try:
+                    r.raw.decode_content = True
+                    with open(part, 'wb') as fh:
+                        shutil.copyfileobj(r.raw, fh, _DOWNLOAD_BUFFER_SIZE)
+                        bytes_written = fh.tell()
+                    if bytes_written == 0:
+                        os.remove(part)
+                        raise ArxivDownloadError("Downloaded file is empty")
+                    os.replace(part, full)
+                except (OSError, urllib3.exceptions.HTTPError) as e:
+                    if os.path.exists(part):
+                        os.remove(part)
+                    if isinstance(e, OSError):
+                        raise ArxivDownloadError(f"File system error during download: {e}") from e
+                    raise ArxivDownloadError(e) from e
+
+                if cached:
                     try:
-                        with open(full, 'wb') as fh:
-                            bytes_written = 0
-                            for chunk in r.iter_content(chunk_size=8192):
-                                if chunk:
-                                    fh.write(chunk)
-                                    bytes_written += len(chunk)
-                        if bytes_written == 0:
-                            os.remove(full)
-                            raise ArxivDownloadError("Downloaded file is empty")
-
-                        # Save paper metadata as JSON
-                        json_path = full.replace('.pdf', '.json')
-                        try:
-                            with open(json_path, 'w', encoding='utf-8') as jf:
-                                jf.write(paper.model_dump_json(indent=2))
-                        except Exception as e:
-                            logger.warning("Failed to save metadata JSON for %s: %s", full, e)
-                            # Don't fail the download for this
+                        self._link_or_copy(full, cached)
                     except OSError as e:
-                        if os.path.exists(full):
-                            os.remove(full)
-                        raise ArxivDownloadError(f"File system error during download: {e}")
-                    return full
-            except (requests.RequestException, OSError) as e:
-                if attempt == 2:
-                    raise ArxivDownloadError(e)
-                backoff = 2 ** attempt
-                logger.warning("Download request failed (attempt %d/3), retrying in %d seconds: %s", attempt + 1, backoff, e)
-                time.sleep(backoff)
+                        logger.warning("Failed to cache PDF %s: %s", full, e)
+                self._write_metadata(paper, full)
+                return full
+        except (requests.RequestException, OSError) as e:
+            raise ArxivDownloadError(e) from e
+
+    def close(self):
+        """Close the session and its pooled keep-alive connections, and the response cache."""
+        self.session.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self) -> "ArxivClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -3,20 +3,20 @@ from academic_sdk.errors import AcademicSDKError, AcademicAPIError, AcademicNetw
 
 class ArxivSDKError(AcademicSDKError):
     """Base class for SDK errors."""
-    pass
+    __slots__ = ()
 
 
 class ArxivAPIError(AcademicAPIError):
-    pass
+    __slots__ = ()
 
 
 class ArxivNetworkError(AcademicNetworkError):
-    pass
+    __slots__ = ()
 
 
 class ArxivParseError(AcademicParseError):
-    pass
+    __slots__ = ()
 
 
 class ArxivDownloadError(AcademicDownloadError):
-    pass
+    __slots__ = ()
@@ -1,18 +1,30 @@
 from __future__ import annotations
 from typing import List, Optional
-from datetime import datetime
+from typing_extensions import Annotated
+from datetime import datetime, timezone
 import re
 import logging
-from urllib.parse import urlparse
+from functools import cached_property
+from urllib.parse import urlparse, urlsplit
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, StringConstraints, TypeAdapter, field_validator, model_validator
+from pydantic.dataclasses import dataclass
 
-from academic_sdk.models import Paper, Author, Link
+from academic_sdk.models import _SLOTS, Paper, Author, Link
 
 logger = logging.getLogger(__name__)
 
+_ABS_RE = re.compile(r"/abs/(.+)$")
+_VER_RE = re.compile(r"v(\d+)$")
+_ARXIV_ID_RE = re.compile(r"\d{4}\.\d{5}")
 
-class Category(BaseModel):
+# Stripped by pydantic-core itself rather than by a Python "before" validator
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+# Several tags per paper, so a slotted dataclass like Link and Author
+@dataclass(frozen=True, config=ConfigDict(extra="ignore"), **_SLOTS)
+class Category:
     """Represents an arXiv category tag."""
     term: str
     scheme: Optional[str] = None
@@ -23,32 +35,39 @@ class ArxivPaper(Paper):
     # Inherit from academic_sdk.models.Paper
     # Add arXiv specific fields
     tags: Optional[List[Category]] = None  # Raw arXiv category tags
-    categories: Optional[List[str]] = Field(default=None)  # Override to allow setting from tags
-    primary_category: Optional[str] = Field(default=None)  # Override
     arxiv_comment: Optional[str] = None
     journal_ref: Optional[str] = None
-
-    model_config = {"extra": "ignore"}
-
-    @model_validator(mode='after')
-    def set_categories_from_tags(self):
-        if self.tags:
-            if not self.categories:
-                self.categories = [tag.term for tag in self.tags]
-            if not self.primary_category:
-                self.primary_category = self.tags[0].term
-        return self
-
-    @field_validator("title", mode="before")
-    def strip_title(cls, v):
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
-    @field_validator("summary", mode="before")
-    def strip_summary(cls, v):
-        if isinstance(v, str):
-            return v.strip()
+    title: _StrippedStr
+    summary: Optional[_StrippedStr] = None  # Abstract
+
+    model_config = ConfigDict(extra="ignore")
+
+    @model_validator(mode='before')
+    @classmethod
+    def set_categories_from_tags(cls, data):
+        # Papers are frozen, so derive categories from the raw tags before construction
+        if not isinstance(data, dict) or not data.get('tags'):
+            return data
+        if data.get('categories') and data.get('primary_category'):
+            return data
+        terms = [t.get('term') if isinstance(t, dict) else getattr(t, 'term', None) for t in data['tags']]
+        data = dict(data)
+        if not data.get('categories'):
+            data['categories'] = terms
+        if not data.get('primary_category'):
+            data['primary_category'] = terms[0]
+        return data
+
+    @field_validator("published", "updated")
+    def ensure_utc(cls, v):
+        # always UTC-aware, so callers can compare without normalizing first;
+        # arXiv stamps carry "Z" already, naive values are taken as UTC
+        if v is None:
+            return v
+        if v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        if v.utcoffset():
+            return v.astimezone(timezone.utc)
         return v
 
     @field_validator("primary_category", mode="before")
@@ -68,42 +87,35 @@ class ArxivPaper(Paper):
         # Fallback to string conversion
         return str(v)
 
-    @property
+    @cached_property
     def pdf_url(self) -> Optional[str]:
         for l in self.links:
-            if l.type == "application/pdf":
-                href = l.href
-                if href:
-                    parsed = urlparse(href)
-                    if parsed.scheme not in ('http', 'https'):
-                        logger.warning("Invalid PDF URL scheme: %s", href)
-                        continue
-                    # ensure URL ends with .pdf; some feeds provide a PDF-like URL
-                    # that lacks the .pdf suffix (e.g. /pdf/2101.00001v2). Normalize
-                    # by appending .pdf when appropriate.
-                    if not href.lower().endswith('.pdf'):
-                        # only append when URL path contains '/pdf/' or matches arXiv patterns
-                        path = parsed.path.rstrip('/')
-                        last_part = path.split('/')[-1]
-                        if ('/pdf/' in href or last_part.startswith('20') or last_part.startswith('arXiv') or
-                            last_part.startswith('v') or re.search(r'\d{4}\.\d{5}', last_part)):
-                            href += '.pdf'
-                    return href
+            href = l.href
+            if not href:
+                continue
+            is_pdf = l.type == "application/pdf"
             # sometimes rel/title indicate pdf
-            if (l.rel and l.rel.lower() == "related") and l.href:
-                href = l.href
-                parsed = urlparse(href)
-                if parsed.scheme not in ('http', 'https'):
-                    logger.warning("Invalid related PDF URL scheme: %s", href)
-                    continue
-                if href.lower().endswith('.pdf'):
-                    return href
-                if '/pdf/' in href:
-                    return href + '.pdf'
+            if not is_pdf and not (l.rel and l.rel.lower() == "related"):
+                continue
+            low = href.lower()
+            if low.partition(':')[0] not in ('http', 'https'):
+                logger.warning("Invalid %sPDF URL scheme: %s", "" if is_pdf else "related ", href)
+                continue
+            if low.endswith('.pdf'):
+                return href
+            if '/pdf/' in href:
+                return href + '.pdf'
+            if is_pdf:
+                # some feeds provide a PDF-like URL that lacks the .pdf suffix;
+                # only append it when the last path segment looks like an arXiv id
+                last_part = urlsplit(href).path.rstrip('/').rpartition('/')[2]
+                if last_part.startswith(('20', 'arXiv', 'v')) or _ARXIV_ID_RE.search(last_part):
+                    href += '.pdf'
+                return href
         # fallback: try to construct from id if possible
         if self.id:
             # id often like http://arxiv.org/abs/XXXX -> pdf URL at /pdf/XXXX
-            m = re.search(r"/abs/(.+)$", self.id)
+            m = _ABS_RE.search(self.id)
             if m:
                 pdf_url = f"https://arxiv.org/pdf/{m.group(1)}.pdf"
                 # Validate the constructed URL
@@ -113,9 +125,9 @@ class ArxivPaper(Paper):
                     logger.warning("Constructed invalid PDF URL: %s", pdf_url)
         return None
 
-    @property
+    @cached_property
     def version(self) -> Optional[int]:
-        m = re.search(r"v(\d+)$", self.id)
+        m = _VER_RE.search(self.id)
         if m:
             try:
                 return int(m.group(1))
@@ -124,6 +136,13 @@ class ArxivPaper(Paper):
         return None
 
 
+# Built once and reused by the clients: validate_python skips the per-call
+# classmethod dispatch that model_validate goes through.
+PAPER_ADAPTER = TypeAdapter(ArxivPaper)
+# Validates a whole page of entries in a single call.
+PAPERS_ADAPTER = TypeAdapter(List[ArxivPaper])
+
+
 class ArxivResultSet(BaseModel):
     entries: List[ArxivPaper] = []
     total_results: Optional[int] = None
@@ -1,6 +1,9 @@
 """PDF processing utilities using PyMuPDF."""
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,16 @@ except ImportError:
     fitz = None
     logger.warning("PyMuPDF not installed; PDF processing unavailable")
 
+# One processor per worker process, created on its first task
+_worker_processor: Optional["ArxivPDFProcessor"] = None
+
+
+def _run_in_worker(method: str, pdf_path: str) -> Any:
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = ArxivPDFProcessor()
+    return getattr(_worker_processor, method)(pdf_path)
+
 
 class ArxivPDFProcessor:
     """Processor for extracting content from arXiv PDFs using PyMuPDF."""
@@ -18,13 +31,36 @@ class ArxivPDFProcessor:
         if fitz is None:
             raise ImportError("PyMuPDF is required for PDF processing. Install with: pip install PyMuPDF")
 
+    @contextmanager
+    def _open(self, pdf_path: str) -> Iterator["fitz.Document"]:
+        # filetype skips PyMuPDF's format sniffing; the document is always closed
+        doc = fitz.open(pdf_path, filetype="pdf")
+        try:
+            yield doc
+        finally:
+            doc.close()
+
+    @staticmethod
+    def _metadata(doc) -> Dict[str, Any]:
+        return dict(doc.metadata)
+
+    @staticmethod
+    def _first_page_text(doc) -> str:
+        return doc[0].get_text() if doc.page_count > 0 else ""
+
+    @staticmethod
+    def _tables(doc) -> List[Dict[str, Any]]:
+        tables = []
+        for page in doc:
+            for tab in page.find_tables():
+                tables.append(tab.to_dict())  # Dict with headers, data
+        return tables
+
     def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
         """Get PDF metadata."""
         try:
-            doc = fitz.open(pdf_path)
-            metadata = doc.metadata
-            doc.close()
-            return dict(metadata)
+            with self._open(pdf_path) as doc:
+                return self._metadata(doc)
         except Exception as e:
             logger.error("Failed to get metadata from %s: %s", pdf_path, e)
             raise
@@ -32,13 +68,8 @@ class ArxivPDFProcessor:
     def extract_first_page_text(self, pdf_path: str) -> str:
         """Extract text from the first page of the PDF."""
         try:
-            doc = fitz.open(pdf_path)
-            if doc.page_count > 0:
-                text = doc[0].get_text()
-            else:
-                text = ""
-            doc.close()
-            return text
+            with self._open(pdf_path) as doc:
+                return self._first_page_text(doc)
         except Exception as e:
             logger.error("Failed to extract first page text from %s: %s", pdf_path, e)
             raise
@@ -46,44 +77,58 @@ class ArxivPDFProcessor:
     def extract_tables(self, pdf_path: str) -> List[Dict[str, Any]]:
         """Extract tables from the PDF as list of dicts."""
         try:
-            doc = fitz.open(pdf_path)
-            tables = []
-            for page in doc:
-                tabs = page.find_tables()
-                for tab in tabs:
-                    tables.append(tab.to_dict())  # Dict with headers, data
-            doc.close()
-            return tables
+            with self._open(pdf_path) as doc:
+                return self._tables(doc)
         except Exception as e:
             logger.error("Failed to extract tables from %s: %s", pdf_path, e)
             raise
 
-    def get_metadata(self, pdf_path: str) -> Dict[str, Any]:
-        """Get PDF metadata."""
+    def extract_all(self, pdf_path: str) -> Dict[str, Any]:
+        """Extract metadata, first-page text and tables with a single open.
+
+        Prefer this over calling the individual methods in turn when processing
+        PDFs in bulk.
+        """
         try:
-            doc = fitz.open(pdf_path)
-            metadata = doc.metadata
-            doc.close()
-            return dict(metadata)
+            with self._open(pdf_path) as doc:
+                return {
+                    "metadata": self._metadata(doc),
+                    "first_page_text": self._first_page_text(doc),
+                    "tables": self._tables(doc),
+                }
         except Exception as e:
-            logger.error("Failed to get metadata from %s: %s", pdf_path, e)
+            logger.error("Failed to extract content from %s: %s", pdf_path, e)
             raise
 
     def extract_text_with_layout(self, pdf_path: str) -> str:
         """Extract text preserving some layout (e.g., paragraphs)."""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                blocks = page.get_text("dict")["blocks"]
-                for block in blocks:
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                text += span["text"] + " "
-                        text += "\n"
-            doc.close()
-            return text
+            with self._open(pdf_path) as doc:
+                # collect pieces and join once; repeated str += is quadratic
+                parts: List[str] = []
+                for page in doc:
+                    blocks = page.get_text("dict")["blocks"]
+                    for block in blocks:
+                        if "lines" in block:
+                            for line in block["lines"]:
+                                for span in line["spans"]:
+                                    parts.append(span["text"])
+                                    parts.append(" ")
+                            parts.append("\n")
+                return "".join(parts)
         except Exception as e:
             logger.error("Failed to extract layout text from %s: %s", pdf_path, e)
-            raise
\ No newline at end of file
+            raise
+
+    def process_many(self, pdf_paths: Iterable[str], workers: Optional[int] = None, method: str = "extract_all") -> List[Any]:
+        """Run ``method`` over many PDFs in parallel worker processes.
+
+        Extraction is CPU-bound, so processes rather than threads are used.
+        ``workers`` defaults to the CPU count. Results are returned in input
+        order once every PDF is done, so the worker pool never outlives the
+        call; the first failure is re-raised.
+        """
+        if method.startswith("_") or not callable(getattr(self, method, None)) or method == "process_many":
+            raise ValueError(f"Unknown processor method: {method}")
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(partial(_run_in_worker, method), pdf_paths, chunksize=4))
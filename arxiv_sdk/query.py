@@ -1,20 +1,44 @@
 from __future__ import annotations
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from calendar import monthrange
 from datetime import datetime, timezone, timedelta
-import re
 import logging
 
 from dateutil import parser as _dateutil_parser
 
 logger = logging.getLogger(__name__)
 
+_DATE_CONFLICT = "Cannot use both today() and date_range() in the same query"
+
+# Tried in order before falling back to dateutil; month-first wins for
+# ambiguous slashed dates, as it does in dateutil.
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d %H:%M",
+    "%Y%m%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%Y%m%d",
+    "%Y-%m",
+    "%Y",
+    "%m/%d/%Y",  # US format
+    "%d/%m/%Y",  # European
+)
+
+
+def _stamp(dt: datetime) -> str:
+    # arXiv's YYYYMMDDHHMM; plain int formatting skips strftime's format parsing
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}{dt.hour:02d}{dt.minute:02d}"
+
 
 def _quote(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
     # Always wrap values in double quotes, escaping any internal quotes
-    safe = text.replace('"', '\\"')
-    return f'"{safe}"'
+    if '"' not in text:
+        return '"' + text + '"'
+    return '"' + text.replace('"', '\\"') + '"'
 
 
 class QueryBuilder:
@@ -24,53 +48,70 @@ class QueryBuilder:
         self.sortOrder: Optional[str] = None
         self.today_used: bool = False
         self.date_range_used: bool = False
+        self._built: Optional[str] = None
+
+    @classmethod
+    def from_params(
+        cls,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        abstract: Optional[str] = None,
+        category: Optional[str] = None,
+        date_range: Optional[Tuple[str, str]] = None,
+    ) -> "QueryBuilder":
+        """Build a query from optional field values in one call; empty values are skipped."""
+        qb = cls()
+        if title:
+            qb.title(title)
+        if author:
+            qb.author(author)
+        if abstract:
+            qb.abstract(abstract)
+        if category:
+            qb.category(category)
+        if date_range:
+            qb.date_range(*date_range)
+        return qb
+
+    def _add(self, part: str) -> "QueryBuilder":
+        self.parts.append(part)
+        self._built = None  # invalidate the cached build() result
+        return self
 
     def title(self, text: str) -> "QueryBuilder":
-        self.parts.append(f"ti:{_quote(text)}")
-        return self
+        return self._add(f"ti:{_quote(text)}")
 
     def author(self, name: str) -> "QueryBuilder":
-        self.parts.append(f"au:{_quote(name)}")
-        return self
+        return self._add(f"au:{_quote(name)}")
 
     def abstract(self, text: str) -> "QueryBuilder":
-        self.parts.append(f"abs:{_quote(text)}")
-        return self
+        return self._add(f"abs:{_quote(text)}")
 
     def comment(self, text: str) -> "QueryBuilder":
-        self.parts.append(f"co:{_quote(text)}")
-        return self
+        return self._add(f"co:{_quote(text)}")
 
     def journal_ref(self, text: str) -> "QueryBuilder":
-        self.parts.append(f"jr:{_quote(text)}")
-        return self
+        return self._add(f"jr:{_quote(text)}")
 
     def category(self, cat: str) -> "QueryBuilder":
-        self.parts.append(f"cat:{_quote(cat)}")
-        return self
+        return self._add(f"cat:{_quote(cat)}")
 
     def doi(self, doi: str) -> "QueryBuilder":
-        self.parts.append(f"doi:{_quote(doi)}")
-        return self
+        return self._add(f"doi:{_quote(doi)}")
 
     def and_(self) -> "QueryBuilder":
-        self.parts.append("AND")
-        return self
+        return self._add("AND")
 
     def or_(self) -> "QueryBuilder":
-        self.parts.append("OR")
-        return self
+        return self._add("OR")
 
     def andnot_(self) -> "QueryBuilder":
-        self.parts.append("ANDNOT")
-        return self
+        return self._add("ANDNOT")
 
     def group(self, qb: Union["QueryBuilder", str]) -> "QueryBuilder":
         if isinstance(qb, QueryBuilder):
-            self.parts.append(f"({qb.build()})")
-        else:
-            self.parts.append(f"({qb})")
-        return self
+            return self._add(f"({qb.build()})")
+        return self._add(f"({qb})")
 
     def sort_by(self, field: str, order: str) -> "QueryBuilder":
         self.sortBy = field
@@ -78,90 +119,75 @@ class QueryBuilder:
         return self
 
     def _parse_date(self, date_input: str) -> datetime:
-        # Handle relative dates
-        if date_input.lower() in ("today", "now"):
-            return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        elif date_input.lower() == "yesterday":
-            return (datetime.now(timezone.utc) - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        elif "last week" in date_input.lower():
-            return (datetime.now(timezone.utc) - timedelta(weeks=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        elif "last month" in date_input.lower():
-            now = datetime.now(timezone.utc)
-            return (now - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        if _dateutil_parser:
+        # Handle relative dates; ISO input never starts with a letter, so skip the checks
+        if date_input[:1].isalpha():
+            lowered = date_input.lower()
+            if lowered in ("today", "now"):
+                return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            elif lowered == "yesterday":
+                return (datetime.now(timezone.utc) - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            elif "last week" in lowered:
+                return (datetime.now(timezone.utc) - timedelta(weeks=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            elif "last month" in lowered:
+                now = datetime.now(timezone.utc)
+                return (now - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # fast paths for the known formats; dateutil has to infer the format
+        try:
+            # fromisoformat only accepts a "Z" suffix from Python 3.11 on
+            dt = datetime.fromisoformat(date_input[:-1] + "+00:00" if date_input.endswith("Z") else date_input)
+        except ValueError:
+            dt = None
+            for fmt in _DATE_FORMATS:
+                try:
+                    dt = datetime.strptime(date_input, fmt)
+                    break
+                except ValueError:
+                    continue
+        if dt is None:
+            if not _dateutil_parser:
+                raise ValueError(f"Unrecognized date format: {date_input}")
             dt = _dateutil_parser.parse(date_input)
-            if dt.tzinfo is None:
-                # assume UTC
-                dt = dt.replace(tzinfo=timezone.utc)
-            else:
-                dt = dt.astimezone(timezone.utc)
-            return dt
-        # fallback parsing with more formats
-        fmts = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y/%m/%d %H:%M",
-            "%Y%m%d %H:%M",
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y%m%d",
-            "%Y-%m",
-            "%Y",
-            "%m/%d/%Y",  # US format
-            "%d/%m/%Y",  # European
-        ]
-        for fmt in fmts:
-            try:
-                dt = datetime.strptime(date_input, fmt)
-                dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                continue
-        raise ValueError(f"Unrecognized date format: {date_input}")
+        if dt.tzinfo is None:
+            # assume UTC
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            dt = dt.astimezone(timezone.utc)
+        return dt
 
     def date_range(self, start: str, end: str, end_inclusive: bool = True) -> "QueryBuilder":
+        if self.today_used:
+            raise ValueError(_DATE_CONFLICT)
         s_dt = self._parse_date(start)
         e_dt = self._parse_date(end)
         # normalize date-only inputs: dateutil will set times if provided; fallback preserved
         # If user supplied a year or year-month without time, dateutil parses to start of period; for end inclusive, expand
         if end_inclusive:
             # if end has zeroed time and looks like date-only, extend to last minute
-            if e_dt.hour == 0 and e_dt.minute == 0 and re.match(r"^\d{4}(-\d{2})?$", end):
-                # if only year or year-month
-                if re.match(r"^\d{4}$", end):
+            if e_dt.hour == 0 and e_dt.minute == 0:
+                # if only year or year-month; plain string checks, no regex needed
+                if len(end) == 4 and end.isdigit():
                     e_dt = e_dt.replace(month=12, day=31, hour=23, minute=59)
-                elif re.match(r"^\d{4}-\d{2}$", end):
+                elif len(end) == 7 and end[4] == '-' and end[:4].isdigit() and end[5:].isdigit():
                     # last day of month
-                    year = e_dt.year
-                    month = e_dt.month
-                    # naive last day calc
-                    if month == 12:
-                        last = 31
-                    else:
-                        next_month = datetime(year, month + 1, 1, tzinfo=timezone.utc)
-                        last = (next_month - timedelta(days=1)).day
+                    last = monthrange(e_dt.year, e_dt.month)[1]
                     e_dt = e_dt.replace(day=last, hour=23, minute=59)
         if s_dt > e_dt:
             raise ValueError("start date must be <= end date")
-        start_fmt = s_dt.strftime("%Y%m%d%H%M")
-        end_fmt = e_dt.strftime("%Y%m%d%H%M")
-        self.parts.append(f"submittedDate:[{start_fmt} TO {end_fmt}]")
         self.date_range_used = True
-        return self
+        return self._add(f"submittedDate:[{_stamp(s_dt)} TO {_stamp(e_dt)}]")
 
     def today(self) -> "QueryBuilder":
+        if self.date_range_used:
+            raise ValueError(_DATE_CONFLICT)
         now = datetime.now(timezone.utc)
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        start_fmt = start_of_day.strftime("%Y%m%d%H%M")
-        end_fmt = end_of_day.strftime("%Y%m%d%H%M")
-        self.parts.append(f"submittedDate:[{start_fmt} TO {end_fmt}]")
         self.today_used = True
-        return self
+        return self._add(f"submittedDate:[{_stamp(start_of_day)} TO {_stamp(end_of_day)}]")
 
     def build(self) -> str:
-        #check and ensure that there isnt both a today and date_range call
-        if self.today_used and self.date_range_used:
-            raise ValueError("Cannot use both today() and date_range() in the same query")
-        return " ".join(self.parts)
+        # today()/date_range() conflicts are rejected when the second one is called
+        if self._built is None:
+            self._built = " ".join(self.parts)
+        return self._built
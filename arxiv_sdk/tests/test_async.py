@@ -1,4 +1,5 @@
 """Tests for async client."""
+import asyncio
 import pytest
 import tempfile
 import os
@@ -22,6 +23,33 @@ class AsyncIter:
         return self.items.pop(0)
 
 
+def _mock_paper():
+    paper = Mock()
+    paper.id = 'http://arxiv.org/abs/2101.00001v2'
+    paper.title = 'Test Paper'
+    paper.pdf_url = 'http://example.com/test.pdf'
+    paper.primary_category = 'cs.AI'
+    return paper
+
+
+def _mock_response(status=200, headers=None, body=None, chunks=None, text=None):
+    """An aiohttp-style response usable as ``async with session.get(...)``."""
+    resp = AsyncMock()
+    resp.status = status
+    resp.url = 'http://example.com/test.pdf'
+    resp.headers = headers or {}
+    resp.raise_for_status = Mock()
+    if body is not None:
+        resp.read = AsyncMock(return_value=body)
+    if chunks is not None:
+        resp.content.iter_chunked = Mock(side_effect=lambda size: AsyncIter(list(chunks)))
+    if text is not None:
+        resp.text = AsyncMock(return_value=text)
+    resp.__aenter__ = AsyncMock(return_value=resp)
+    resp.__aexit__ = AsyncMock(return_value=None)
+    return resp
+
+
 @pytest.mark.asyncio
 async def test_async_search():
     client = AsyncArxivClient()
@@ -55,28 +83,35 @@ async def test_async_invalid_query():
         await client.close()
 
 
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_session():
+    async with AsyncArxivClient() as client:
+        assert not client.session.closed
+    assert client.session.closed
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_concurrent_callers():
+    """Concurrent callers each reserve their own slot instead of firing together."""
+    client = AsyncArxivClient(rate_limit=0.05, max_concurrent=3)
+    try:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(client._apply_rate_limit() for _ in range(3)))
+        assert loop.time() - start >= 0.09
+    finally:
+        await client.close()
+
+
 @pytest.mark.asyncio
 async def test_async_download_success():
     """Test successful PDF download."""
     with tempfile.TemporaryDirectory() as tmpdir:
         client = AsyncArxivClient()
         try:
-            # Mock paper
-            paper = Mock()
-            paper.id = 'http://arxiv.org/abs/2101.00001v2'
-            paper.title = 'Test Paper'
-            paper.pdf_url = 'http://example.com/test.pdf'
-            paper.primary_category = 'cs.AI'
-
-            # Mock response
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.url = 'http://example.com/test.pdf'
-            mock_response.headers = {'content-length': '13'}
-            mock_response.content.iter_chunked = Mock(side_effect=lambda size: AsyncIter([b'fake pdf data']))
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
-            mock_response.raise_for_status = Mock()
+            paper = _mock_paper()
+
+            mock_response = _mock_response(headers={'content-length': '13'}, chunks=[b'fake pdf data'])
 
             with patch.object(client.session, 'get', return_value=mock_response):
                 path = await client.download_pdf(paper, tmpdir)
@@ -94,20 +129,8 @@ async def test_async_download_empty_response():
     with tempfile.TemporaryDirectory() as tmpdir:
         client = AsyncArxivClient()
         try:
-            paper = Mock()
-            paper.id = 'http://arxiv.org/abs/2101.00001v2'
-            paper.title = 'Test Paper'
-            paper.pdf_url = 'http://example.com/test.pdf'
-            paper.primary_category = 'cs.AI'
-
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.url = 'http://example.com/test.pdf'
-            mock_response.headers = {'content-length': '10'}
-            mock_response.content.iter_chunked = Mock(side_effect=lambda size: AsyncIter([]))
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
-            mock_response.raise_for_status = Mock()
+            paper = _mock_paper()
+            mock_response = _mock_response(headers={'content-length': '10'}, chunks=[])
 
             with patch.object(client.session, 'get', return_value=mock_response):
                 with pytest.raises(ArxivDownloadError, match="Downloaded file is empty"):
@@ -122,20 +145,8 @@ async def test_async_download_content_length_zero():
     with tempfile.TemporaryDirectory() as tmpdir:
         client = AsyncArxivClient()
         try:
-            paper = Mock()
-            paper.id = 'http://arxiv.org/abs/2101.00001v2'
-            paper.title = 'Test Paper'
-            paper.pdf_url = 'http://example.com/test.pdf'
-            paper.primary_category = 'cs.AI'
-
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.url = 'http://example.com/test.pdf'
-            mock_response.headers = {'content-length': '0'}
-            mock_response.content.iter_chunked = Mock(side_effect=lambda size: AsyncIter([]))
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
-            mock_response.raise_for_status = Mock()
+            paper = _mock_paper()
+            mock_response = _mock_response(headers={'content-length': '0'}, chunks=[])
 
             with patch.object(client.session, 'get', return_value=mock_response):
                 with pytest.raises(ArxivDownloadError, match="Empty response"):
@@ -150,22 +161,91 @@ async def test_async_download_http_error():
     with tempfile.TemporaryDirectory() as tmpdir:
         client = AsyncArxivClient()
         try:
-            paper = Mock()
-            paper.id = 'http://arxiv.org/abs/2101.00001v2'
-            paper.title = 'Test Paper'
-            paper.pdf_url = 'http://example.com/test.pdf'
-            paper.primary_category = 'cs.AI'
-
-            mock_response = AsyncMock()
-            mock_response.status = 404
-            mock_response.url = 'http://example.com/test.pdf'
-            mock_response.text = AsyncMock(return_value="Not Found")
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
+            paper = _mock_paper()
+            mock_response = _mock_response(status=404, text="Not Found")
             mock_response.raise_for_status = Mock(side_effect=Exception("404"))
 
             with patch.object(client.session, 'get', return_value=mock_response):
                 with pytest.raises(Exception):  # ArxivAPIError or similar
                     await client.download_pdf(paper, tmpdir)
         finally:
-            await client.close()
\ No newline at end of file
+            await client.close()
+
+
+FEED_TWO_ENTRIES = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2101.00002v1</id>
+    <title>Second</title>
+    <summary>B</summary>
+    <published>2021-01-02T00:00:00Z</published>
+    <updated>2021-01-02T00:00:00Z</updated>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v3</id>
+    <title>First</title>
+    <summary>A</summary>
+    <published>2021-01-01T00:00:00Z</published>
+    <updated>2021-01-01T00:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_by_id_single_request():
+    """All IDs go out in one id_list request and come back in caller order."""
+    client = AsyncArxivClient(rate_limit=0)
+    try:
+        mock_response = _mock_response(body=FEED_TWO_ENTRIES.encode())
+
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            papers = await client.get_many_by_id(["2101.00001", "2101.00002v1", "2101.00003"])
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs['params']['id_list'] == "2101.00001,2101.00002v1,2101.00003"
+        assert [p.title if p else None for p in papers] == ["First", "Second", None]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookup_served_from_cache_dir(tmp_path):
+    """A repeated ID lookup with a cache_dir makes no second request."""
+    client = AsyncArxivClient(rate_limit=0, cache_dir=str(tmp_path))
+    try:
+        mock_response = _mock_response(body=FEED_TWO_ENTRIES.encode())
+
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            first = await client.get_many_by_id(["2101.00001", "2101.00002v1"])
+            second = await client.get_many_by_id(["2101.00001", "2101.00002v1"])
+        assert mock_get.call_count == 1
+        assert [p.title for p in second] == [p.title for p in first] == ["First", "Second"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_throttled_search_is_retried():
+    """A 429 is retried after its Retry-After delay instead of failing the call."""
+    client = AsyncArxivClient(rate_limit=0)
+    try:
+        throttled = _mock_response(status=429, headers={"Retry-After": "0"}, text="slow down")
+        ok = _mock_response(body=FEED_TWO_ENTRIES.encode())
+
+        with patch.object(client.session, 'get', side_effect=[throttled, ok]) as mock_get:
+            results = await client.search("all:test", max_results=2)
+        assert mock_get.call_count == 2
+        assert sorted(p.title for p in results.entries) == ["First", "Second"]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_download_many_can_collect_failures():
+    client = AsyncArxivClient()
+    try:
+        failure = ArxivDownloadError("boom")
+        with patch.object(client, "download_pdf", AsyncMock(side_effect=["a.pdf", failure, "c.pdf"])):
+            results = await client.download_many([Mock(), Mock(), Mock()], "/tmp", return_exceptions=True)
+        assert results == ["a.pdf", failure, "c.pdf"]
+    finally:
+        await client.close()
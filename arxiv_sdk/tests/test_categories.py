@@ -22,3 +22,8 @@ def test_load_full_taxonomy():
     tax = load_full_taxonomy()
     assert isinstance(tax, dict)
     assert "cs.LG" in tax
+
+
+def test_get_description_by_enum_and_unknown_code():
+    assert get_category_description(Category.CS_LG) == get_category_description("cs.LG")
+    assert get_category_description("not.a.category") is None
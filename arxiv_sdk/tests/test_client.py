@@ -1,4 +1,45 @@
+import io
+import os
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+
 from arxiv_sdk import ArxivClient
+from arxiv_sdk.errors import ArxivParseError
+from arxiv_sdk.models import ArxivPaper
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <opensearch:totalResults>42</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>
+  <opensearch:itemsPerPage>1</opensearch:itemsPerPage>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v2</id>
+    <published>2021-01-01T00:00:00Z</published>
+    <updated>2021-02-01T00:00:00Z</updated>
+    <title>  A Paper </title>
+    <summary>Abstract</summary>
+    <author><name>Alice</name></author>
+    <link href="http://arxiv.org/pdf/2101.00001v2" rel="related" type="application/pdf" title="pdf"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+PAPER = ArxivPaper(id="http://arxiv.org/abs/2101.00001v2", title="A Paper", primary_category="cs.LG")
+
+
+def _pdf_session():
+    """A session whose streamed GET serves PAPER's PDF."""
+    resp = MagicMock(headers={}, url="http://arxiv.org/pdf/2101.00001v2.pdf", raw=io.BytesIO(b"%PDF-1.4 data"))
+    resp.__enter__.return_value = resp
+    session = Mock()
+    session.get.return_value = resp
+    return session
 
 
 def test_search_empty_query():
@@ -34,4 +75,141 @@ def test_search_max_results_too_large():
         client.search("test", max_results=3000)
         assert False, "Should raise ValueError"
     except ValueError as e:
-        assert "2000" in str(e)
\ No newline at end of file
+        assert "2000" in str(e)
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+def test_search_parses_feed(use_lxml):
+    session = Mock()
+    # split mid-entry to exercise incremental parsing
+    chunks = [FEED[:400], FEED[400:]]
+    session.get.return_value = Mock(status_code=200, text=FEED.decode(), iter_content=Mock(return_value=iter(chunks)))
+    client = ArxivClient(session=session, use_lxml=use_lxml)
+    results = client.search("all:test", max_results=1)
+    assert results.total_results == 42
+    assert results.items_per_page == 1
+    paper = results.entries[0]
+    assert paper.title == "A Paper"
+    assert paper.authors[0].name == "Alice"
+    assert paper.primary_category == "cs.LG"
+    assert paper.pdf_url == "http://arxiv.org/pdf/2101.00001v2.pdf"
+
+
+def test_repeat_query_served_from_cache_dir(tmp_path):
+    session = Mock()
+    session.get.side_effect = lambda *a, **kw: Mock(status_code=200, iter_content=Mock(return_value=iter([FEED])))
+    with ArxivClient(session=session, cache_dir=str(tmp_path)) as client:
+        first = client.search("all:test", max_results=1)
+        second = client.search("all:test", max_results=1)
+    assert session.get.call_count == 1
+    assert second.entries[0].id == first.entries[0].id
+    assert second.total_results == 42
+
+
+def test_default_session_retries_transient_errors():
+    adapter = ArxivClient().session.get_adapter("https://export.arxiv.org/api/query")
+    assert adapter.max_retries.total == 2
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_injected_session_headers_left_untouched():
+    session = requests.Session()
+    before = dict(session.headers)
+    client = ArxivClient(session=session, user_agent="test-agent/1.0")
+    with patch.object(session, "get", return_value=Mock(status_code=200, iter_content=Mock(return_value=iter([FEED])))) as get:
+        client.search("all:test", max_results=1)
+    assert dict(session.headers) == before
+    assert get.call_args.kwargs["headers"] == {"User-Agent": "test-agent/1.0"}
+    assert ArxivClient(user_agent="test-agent/1.0").session.headers["User-Agent"] == "test-agent/1.0"
+
+
+def test_context_manager_closes_session():
+    session = Mock()
+    with ArxivClient(session=session) as client:
+        assert client.session is session
+    session.close.assert_called_once()
+
+
+def test_rate_limit_only_throttles_sustained_traffic():
+    client = ArxivClient(rate_limit=3.0, rate_limit_burst=2)
+    with patch("academic_sdk.ratelimit.time.sleep") as sleep:
+        client._apply_rate_limit()
+        client._apply_rate_limit()
+        sleep.assert_not_called()
+        client._apply_rate_limit()
+        assert sleep.call_count == 1
+        assert 2.9 < sleep.call_args[0][0] <= 3.0
+
+
+def test_download_pdf_writes_via_part_file(tmp_path):
+    session = _pdf_session()
+    path = ArxivClient(session=session).download_pdf(PAPER, str(tmp_path))
+    assert path == os.path.join(str(tmp_path), "CS_LG", "a_paper-2101.00001v2.pdf")
+    with open(path, "rb") as fh:
+        assert fh.read() == b"%PDF-1.4 data"
+    assert not os.path.exists(path + ".part")
+    assert os.path.exists(path[:-4] + ".json")
+
+
+def test_metadata_sidecar_beside_pdf_under_pdf_named_dir(tmp_path):
+    session = _pdf_session()
+    hub = tmp_path / "papers.pdf"
+    hub.mkdir()
+    path = ArxivClient(session=session).download_pdf(PAPER, str(hub))
+    assert os.path.exists(os.path.splitext(path)[0] + ".json")
+
+
+def test_download_pdf_existing_file_skips_request(tmp_path):
+    (tmp_path / "CS_LG").mkdir()
+    existing = tmp_path / "CS_LG" / "a_paper-2101.00001v2.pdf"
+    existing.write_bytes(b"%PDF")
+    session = Mock()
+    assert ArxivClient(session=session).download_pdf(PAPER, str(tmp_path)) == str(existing)
+    session.get.assert_not_called()
+
+
+def test_search_reports_index_of_malformed_entry():
+    # second entry has no <title>
+    bad = FEED.replace(b"</feed>", b"<entry><id>http://arxiv.org/abs/2101.00002v1</id></entry></feed>")
+    session = Mock()
+    session.get.return_value = Mock(status_code=200, iter_content=Mock(return_value=iter([bad])))
+    with pytest.raises(ArxivParseError, match="1 entries failed to parse \\(first at index 1\\)"):
+        ArxivClient(session=session).search("all:test")
+
+
+def test_get_many_by_id_single_request():
+    session = Mock()
+    session.get.return_value = Mock(status_code=200, iter_content=Mock(return_value=iter([FEED])))
+    papers = ArxivClient(session=session).get_many_by_id(["2101.00001", "2101.00009v1"])
+    assert session.get.call_count == 1
+    assert session.get.call_args.kwargs["params"]["id_list"] == "2101.00001,2101.00009v1"
+    assert papers[0].title == "A Paper"
+    assert papers[1] is None
+
+
+def test_download_pdf_reuses_pdf_cache(tmp_path):
+    session = _pdf_session()
+    client = ArxivClient(session=session, pdf_cache_dir=str(tmp_path / "cache"))
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    client.download_pdf(PAPER, str(first))
+    assert (tmp_path / "cache" / "2101.00001v2.pdf").read_bytes() == b"%PDF-1.4 data"
+    path = client.download_pdf(PAPER, str(second))
+    assert session.get.call_count == 1
+    with open(path, "rb") as fh:
+        assert fh.read() == b"%PDF-1.4 data"
+
+
+def test_download_pdf_overwrite_refreshes_pdf_cache(tmp_path):
+    session = _pdf_session()
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "2101.00001v2.pdf").write_bytes(b"%PDF-trunc")
+    hub = tmp_path / "hub"
+    hub.mkdir()
+    path = ArxivClient(session=session, pdf_cache_dir=str(cache)).download_pdf(PAPER, str(hub), overwrite=True)
+    assert session.get.call_count == 1
+    with open(path, "rb") as fh:
+        assert fh.read() == b"%PDF-1.4 data"
+    assert (cache / "2101.00001v2.pdf").read_bytes() == b"%PDF-1.4 data"
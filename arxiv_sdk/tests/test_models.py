@@ -1,5 +1,7 @@
+import pytest
+from pydantic import ValidationError
 from arxiv_sdk.models import ArxivPaper, Link, Author
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 
 def make_entry():
@@ -104,3 +106,41 @@ def test_pdf_url_no_pdf():
     }
     p = ArxivPaper.model_validate(entry)
     assert p.pdf_url is None
+
+
+def test_categories_from_tags_and_frozen():
+    entry = make_entry()
+    entry['tags'] = [{'term': 'cs.LG'}, {'term': 'stat.ML'}]
+    p = ArxivPaper.model_validate(entry)
+    assert p.categories == ['cs.LG', 'stat.ML']
+    assert p.primary_category == 'cs.LG'
+    with pytest.raises(ValidationError):
+        p.title = 'Changed'
+
+
+def test_derived_properties_cached_but_not_serialized():
+    p = ArxivPaper.model_validate(make_entry())
+    assert p.pdf_url is p.pdf_url
+    assert p.version == 2
+    assert {'pdf_url', 'version'} <= p.__dict__.keys()
+    assert 'pdf_url' not in p.model_dump()
+    assert p == ArxivPaper.model_validate(make_entry())
+
+
+def test_display_strings():
+    p = ArxivPaper.model_validate(make_entry())
+    assert p.published_str == '2021-01-01'
+    assert p.updated_str == '2021-02-01'
+    assert p.authors_str == 'Alice, Bob'
+    assert 'published_str' not in p.model_dump()
+    assert ArxivPaper(id='x', title='t').published_str is None
+
+
+def test_dates_normalized_to_utc():
+    entry = make_entry()
+    entry['published'] = '2021-01-01T02:00:00+02:00'
+    entry['updated'] = '2021-02-01T00:00:00'
+    p = ArxivPaper.model_validate(entry)
+    assert p.published == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert p.published.utcoffset() == timedelta(0)
+    assert p.updated.tzinfo is not None
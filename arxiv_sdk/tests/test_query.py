@@ -15,6 +15,11 @@ def test_date_range():
     assert '20230101' in s
 
 
+def test_date_range_utc_suffix():
+    s = QueryBuilder().date_range('2023-01-01T12:30:00Z', '2023-01-02').build()
+    assert 'submittedDate:[202301011230 TO 202301020000]' in s
+
+
 def test_invalid_date_format():
     qb = QueryBuilder()
     try:
@@ -25,9 +30,14 @@ def test_invalid_date_format():
 
 
 def test_today_and_date_range_conflict():
-    qb = QueryBuilder().today().date_range('2023-01-01', '2023-12-31')
+    qb = QueryBuilder().today()
+    try:
+        qb.date_range('2023-01-01', '2023-12-31')
+        assert False, "Should raise ValueError"
+    except ValueError:
+        pass
     try:
-        qb.build()
+        QueryBuilder().date_range('2023-01-01', '2023-12-31').today()
         assert False, "Should raise ValueError"
     except ValueError:
         pass
@@ -37,3 +47,21 @@ def test_doi():
     qb = QueryBuilder().doi("10.1234/test")
     s = qb.build()
     assert 'doi:"10.1234/test"' in s
+
+
+def test_partial_dates_cover_whole_period():
+    assert QueryBuilder().date_range('2023-02', '2023-02').build() == 'submittedDate:[202302010000 TO 202302282359]'
+    assert QueryBuilder().date_range('2022', '2022').build() == 'submittedDate:[202201010000 TO 202212312359]'
+
+
+def test_build_is_cached_until_mutated():
+    qb = QueryBuilder().title("a")
+    assert qb.build() is qb.build()
+    qb.and_().author("b")
+    assert qb.build() == 'ti:"a" AND au:"b"'
+
+
+def test_from_params_matches_chained_calls():
+    chained = QueryBuilder().title("a").category("cs.AI").date_range("2024-01-01", "2024-01-31")
+    qb = QueryBuilder.from_params(title="a", author="", category="cs.AI", date_range=("2024-01-01", "2024-01-31"))
+    assert qb.build() == chained.build()
@@ -1,8 +1,13 @@
 """Main Textual app for Arxiv TUI."""
+import asyncio
+
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, TabbedContent, TabPane
 from textual.binding import Binding
 
+from arxiv_sdk.async_client import AsyncArxivClient
+from semantic_scholar_sdk.client import SemanticScholarClient
+
 from .screens.search import SearchTab
 from .screens.semantic_scholar_search import SemanticScholarSearchTab
 from .screens.downloads import DownloadsTab
@@ -110,9 +115,8 @@ class ArxivTUI(App):
 
     def on_mount(self) -> None:
         """Set up on app start."""
-        from arxiv_sdk.async_client import AsyncArxivClient
+        # clients are imported at module load so mounting never stalls first paint
         self.client = AsyncArxivClient()
-        from semantic_scholar_sdk.client import SemanticScholarClient
         self.ss_client = SemanticScholarClient()
 
     def compose(self) -> ComposeResult:
@@ -130,6 +134,7 @@ class ArxivTUI(App):
     def action_quit(self) -> None:
         """Quit the app."""
         if hasattr(self.client, 'close'):
-            import asyncio
             asyncio.create_task(self.client.close())
+        if hasattr(self, 'ss_client'):
+            self.ss_client.close()
         self.exit()
\ No newline at end of file
@@ -14,16 +14,19 @@ class DetailsScreen(Screen):
     def __init__(self, paper: ArxivPaper):
         super().__init__()
         self.paper = paper
+        # display strings are fixed for the screen's lifetime; build them once
+        self._authors_str = paper.authors_str
+        self._pub_str = paper.published_str or 'N/A'
+        self._upd_str = paper.updated_str or 'N/A'
 
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("Paper Details", classes="title")
             with ScrollableContainer():
                 yield Label(f"Title: {self.paper.title}")
-                authors = ", ".join(a.name for a in self.paper.authors)
-                yield Label(f"Authors: {authors}")
-                yield Label(f"Published: {self.paper.published.strftime('%Y-%m-%d') if self.paper.published else 'N/A'}")
-                yield Label(f"Updated: {self.paper.updated.strftime('%Y-%m-%d') if self.paper.updated else 'N/A'}")
+                yield Label(f"Authors: {self._authors_str}")
+                yield Label(f"Published: {self._pub_str}")
+                yield Label(f"Updated: {self._upd_str}")
                 yield Label(f"Category: {self.paper.primary_category}")
                 yield Label(f"DOI: {self.paper.doi or 'N/A'}")
                 yield Label("Abstract:")
@@ -1,10 +1,51 @@
 """Downloads tab for the TUI."""
+import copy
 import os
 import json
+from functools import lru_cache
 from textual.containers import Vertical, ScrollableContainer
 from textual.widgets import ListView, ListItem, Label, Button, Static
 from textual import on
 
+from .view_paper import PaperDetailsScreen
+
+
+def _iter_pdfs(root: str):
+    """Yield paths of PDFs under ``root``; DirEntry answers is_dir without a stat."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_pdfs(entry.path)
+            elif entry.name.endswith('.pdf'):
+                yield entry.path
+
+
+def _hub_signature(root: str) -> tuple:
+    """Modification times of the hub and its category folders.
+
+    Downloads land one level down (``<hub>/<CATEGORY>/<file>.pdf``), so adding
+    or removing a PDF always changes one of these.
+    """
+    sig = [('', os.stat(root).st_mtime_ns)]
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sig.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+    sig.sort()
+    return tuple(sig)
+
+
+@lru_cache(maxsize=256)
+def _parse_json_meta(path: str, mtime_ns: int) -> dict:
+    """Parse a metadata sidecar; ``mtime_ns`` is part of the key so edits are re-read."""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _load_json_meta(path: str, mtime_ns: int) -> dict:
+    """A caller-owned copy of the cached sidecar, so edits never reach the cache."""
+    return copy.deepcopy(_parse_json_meta(path, mtime_ns))
+
 
 class DownloadsTab(Vertical):
     """Tab for viewing downloaded papers."""
@@ -12,6 +53,7 @@ class DownloadsTab(Vertical):
     def __init__(self):
         super().__init__()
         self.downloads_path = None  # Set by app
+        self._last_signature = None
 
     def compose(self):
         self.downloads_path = self.app.downloads_path
@@ -27,38 +69,44 @@ class DownloadsTab(Vertical):
 
     def load_downloads(self):
         """Load list of downloaded PDFs."""
-        if not os.path.exists(self.downloads_path):
+        try:
+            signature = _hub_signature(self.downloads_path)
+        except FileNotFoundError:
             return
+        # on_show fires on every tab switch; only rescan when something changed
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
 
         list_view = self.query_one("#downloads_list", ListView)
         list_view.clear()
 
-        for root, dirs, files in os.walk(self.downloads_path):
-            for file in files:
-                if file.endswith('.pdf'):
-                    full_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(full_path, self.downloads_path)
-                    item = ListItem(Label(rel_path))
-                    item.path = full_path
-                    list_view.append(item)
+        prefix_len = len(os.path.join(self.downloads_path, ''))
+        items = []
+        for full_path in _iter_pdfs(self.downloads_path):
+            item = ListItem(Label(full_path[prefix_len:]))
+            item.path = full_path
+            items.append(item)
+        # one batch instead of a refresh per appended item
+        list_view.extend(items)
 
     @on(ListView.Selected)
     def show_paper(self, event):
         """Show selected paper details."""
         pdf_path = event.item.path
         # Load from JSON metadata
-        data = {}
-        json_path = pdf_path.replace('.pdf', '.json')
-        if os.path.exists(json_path):
+        # swap only the extension; replace() would also hit ".pdf" in folder names
+        json_path = os.path.splitext(pdf_path)[0] + '.json'
+        try:
+            mtime_ns = os.stat(json_path).st_mtime_ns
+        except FileNotFoundError:
+            data = {'summary': 'No metadata available'}
+        else:
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_meta(json_path, mtime_ns)
             except Exception as e:
                 self.app.notify(f"Failed to load metadata: {e}", severity="warning")
                 data = {'summary': 'Failed to load metadata'}
-        else:
-            data = {'summary': 'No metadata available'}
-        from .view_paper import PaperDetailsScreen
         filename = os.path.basename(pdf_path)
         self.app.push_screen(PaperDetailsScreen(data=data, filename=filename, pdf_path=pdf_path))
 
@@ -1,4 +1,6 @@
 """Results screen for displaying search results."""
+import asyncio
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import Screen
@@ -7,6 +9,29 @@ from textual import on
 
 from arxiv_sdk.models import ArxivPaper
 
+from .details import DetailsScreen
+
+
+def truncate(text: str, n: int = 50) -> str:
+    """``text`` cut to ``n`` characters, with "..." appended when cut."""
+    return text if len(text) <= n else text[:n] + "..."
+
+
+def short_authors(authors) -> str:
+    """First two author names, with "et al." when there are more."""
+    n = len(authors)
+    if n == 0:
+        return ""
+    if n == 1:
+        return authors[0].name
+    names = authors[0].name + ", " + authors[1].name
+    return names + " et al." if n > 2 else names
+
+
+def result_row(paper: ArxivPaper) -> tuple:
+    """Table cells for a paper: title, first two authors, date, category."""
+    return truncate(paper.title), short_authors(paper.authors), paper.published_str or "N/A", paper.primary_category or "N/A"
+
 
 class ResultsScreen(Screen):
     """Screen for displaying search results in a table."""
@@ -14,6 +39,7 @@ class ResultsScreen(Screen):
     def __init__(self):
         super().__init__()
         self.results = None
+        self._by_id = {}
 
     def on_mount(self) -> None:
         """Load results on mount."""
@@ -26,7 +52,6 @@ class ResultsScreen(Screen):
             return
 
         # Perform search
-        import asyncio
         asyncio.create_task(self._do_search())
 
     async def _do_search(self):
@@ -34,6 +59,7 @@ class ResultsScreen(Screen):
         try:
             results = await self.app.client.search(self.app.query, max_results=self.app.max_results)
             self.results = results.entries
+            self._by_id = {p.id: p for p in self.results}
             self.display_results()
         except Exception as e:
             self.notify(f"Search failed: {e}", severity="error")
@@ -43,17 +69,9 @@ class ResultsScreen(Screen):
         table = self.query_one(DataTable)
         table.clear()
         table.add_columns("Title", "Authors", "Date", "Category")
-        for paper in self.results:
-            authors = ", ".join(a.name for a in paper.authors[:2])  # First 2 authors
-            if len(paper.authors) > 2:
-                authors += " et al."
-            table.add_row(
-                paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
-                authors,
-                paper.published.strftime("%Y-%m-%d") if paper.published else "N/A",
-                paper.primary_category or "N/A",
-                key=paper.id  # Use ID as key
-            )
+        with self.app.batch_update():
+            for paper in self.results:
+                table.add_row(*result_row(paper), key=paper.id)  # Use ID as key
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -64,10 +82,8 @@ class ResultsScreen(Screen):
     @on(DataTable.RowSelected)
     def row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection."""
-        paper_id = event.row_key
-        paper = next((p for p in self.results if p.id == paper_id), None)
+        paper = self._by_id.get(event.row_key.value)
         if paper:
-            from .details import DetailsScreen
             self.app.push_screen(DetailsScreen(paper))
 
     @on(Button.Pressed, "#back")
@@ -1,13 +1,51 @@
 """Search tab for the TUI."""
 import calendar
 from datetime import datetime
+from functools import lru_cache
 
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Input, Button, Select, Label, Static, DataTable
 
 from textual import on
 
-from arxiv_sdk.categories import Category, CATEGORY_DESCRIPTIONS
+from arxiv_sdk.categories import CATEGORY_DESCRIPTIONS
+from arxiv_sdk.query import QueryBuilder
+
+from .results import result_row
+from .view_paper import PaperDetailsScreen
+
+# Static Select options, built once at import rather than on every compose()
+_CATEGORY_OPTIONS = tuple((desc, code.value) for code, desc in CATEGORY_DESCRIPTIONS.items())
+_MONTH_OPTIONS = tuple((calendar.month_name[m], str(m)) for m in range(1, 13))
+_DAY_OPTIONS = tuple((str(d), str(d)) for d in range(1, 32))
+
+
+def _select_int(select: Select):
+    # BLANK is a sentinel, so an identity test is enough
+    value = select.value
+    return None if value is Select.BLANK else int(value)
+
+
+# Sort keys for the results table, indexed by column: title, authors, date, category.
+# ISO dates order correctly as strings; missing dates and categories sort first.
+_SORT_KEYS = (
+    lambda row: row[0].lower(),
+    lambda row: row[1].lower(),
+    lambda row: row[2] if row[2] != "N/A" else "",
+    lambda row: row[3].lower() if row[3] != "N/A" else "",
+)
+
+
+@lru_cache(maxsize=1)
+def _year_options(current_year: int) -> tuple:
+    """Year options up to ``current_year``; keyed by year so an app left running picks up the new one."""
+    return tuple((str(y), str(y)) for y in reversed(range(2000, current_year + 1)))
+
+
+@lru_cache(maxsize=64)
+def _day_options(year, month: int) -> tuple:
+    """Day options for a month; a leap year stands in while no year is picked."""
+    return _DAY_OPTIONS[:calendar.monthrange(year or 2000, month)[1]]
 
 
 class SearchTab(Vertical):
@@ -16,13 +54,26 @@ class SearchTab(Vertical):
     def __init__(self):
         super().__init__()
         self.papers = []
+        self._columns_added = False
+        self._paper_by_id = {}
         self.sort_reverse = {}
 
     def compose(self):
-        current_year = datetime.now().year
-        year_options = [(str(y), str(y)) for y in reversed(range(2000, current_year + 1))]
-        month_options = [(calendar.month_name[m], str(m)) for m in range(1, 13)]
-        day_options = [(str(d), str(d)) for d in range(1, 32)]
+        # Keep widget references so the event handlers never walk the DOM
+        self._title_input = Input(placeholder="Enter title keywords", id="title")
+        self._author_input = Input(placeholder="Enter author name", id="author")
+        self._abstract_input = Input(placeholder="Enter abstract keywords", id="abstract")
+        self._category_select = Select(_CATEGORY_OPTIONS, prompt="Select category", id="category")
+        year_options = _year_options(datetime.now().year)
+        self._start_year = Select(year_options, prompt="Year", id="start_year", classes="date-select")
+        self._start_month = Select(_MONTH_OPTIONS, prompt="Month", id="start_month", classes="date-select month-select")
+        self._start_day = Select(_DAY_OPTIONS, prompt="Day", id="start_day", classes="date-select")
+        self._end_year = Select(year_options, prompt="Year", id="end_year", classes="date-select")
+        self._end_month = Select(_MONTH_OPTIONS, prompt="Month", id="end_month", classes="date-select month-select")
+        self._end_day = Select(_DAY_OPTIONS, prompt="Day", id="end_day", classes="date-select")
+        self._max_results_input = Input(value="10", placeholder="Max results", id="max_results")
+        self._search_button = Button("Search", id="search", variant="primary")
+        self._results_table = DataTable(cursor_type="row", show_cursor=True, id="results_table")
 
         with Horizontal():
             with Vertical(id="search_panel"):
@@ -31,60 +82,66 @@ class SearchTab(Vertical):
                     with Horizontal():
                         with Vertical():
                             yield Label("Title:")
-                            yield Input(placeholder="Enter title keywords", id="title")
+                            yield self._title_input
                         with Vertical():
                             yield Label("Author:")
-                            yield Input(placeholder="Enter author name", id="author")
+                            yield self._author_input
                     with Horizontal():
                         with Vertical():
                             yield Label("Abstract:")
-                            yield Input(placeholder="Enter abstract keywords", id="abstract")
+                            yield self._abstract_input
                         with Vertical():
                             yield Label("Category:")
-                            yield Select(
-                                [(desc, code.value) for code, desc in CATEGORY_DESCRIPTIONS.items()],
-                                prompt="Select category",
-                                id="category"
-                            )
+                            yield self._category_select
                     yield Label("Start Date:")
                     with Horizontal(classes="date-row"):
-                        yield Select(year_options, prompt="Year", id="start_year", classes="date-select")
-                        yield Select(month_options, prompt="Month", id="start_month", classes="date-select month-select")
-                        yield Select(day_options, prompt="Day", id="start_day", classes="date-select")
+                        yield self._start_year
+                        yield self._start_month
+                        yield self._start_day
                     yield Label("End Date:")
                     with Horizontal(classes="date-row"):
-                        yield Select(year_options, prompt="Year", id="end_year", classes="date-select")
-                        yield Select(month_options, prompt="Month", id="end_month", classes="date-select month-select")
-                        yield Select(day_options, prompt="Day", id="end_day", classes="date-select")
+                        yield self._end_year
+                        yield self._end_month
+                        yield self._end_day
                     with Horizontal():
                         with Vertical():
                             yield Label("Max Results:")
-                            yield Input(value="10", placeholder="Max results", id="max_results")
+                            yield self._max_results_input
                         with Vertical():
-                            yield Button("Search", id="search", variant="primary")
+                            yield self._search_button
             with Vertical(id="results_panel"):
-                  yield DataTable(cursor_type="row", show_cursor=True, id="results_table")
+                  yield self._results_table
+
+    def _trim_days(self, year_select: Select, month_select: Select, day_select: Select) -> None:
+        """Offer only the days that exist in the chosen month, keeping a still-valid day."""
+        month = _select_int(month_select)
+        options = _DAY_OPTIONS if month is None else _day_options(_select_int(year_select), month)
+        day = _select_int(day_select)
+        day_select.set_options(options)  # resets the selection
+        if day is not None and day <= len(options):
+            day_select.value = str(day)
+
+    @on(Select.Changed, "#start_year, #start_month")
+    def _start_period_changed(self) -> None:
+        self._trim_days(self._start_year, self._start_month, self._start_day)
+
+    @on(Select.Changed, "#end_year, #end_month")
+    def _end_period_changed(self) -> None:
+        self._trim_days(self._end_year, self._end_month, self._end_day)
 
     @on(Button.Pressed, "#search")
     async def search(self) -> None:
         """Perform search and display results."""
-        title = self.query_one("#title", Input).value
-        author = self.query_one("#author", Input).value
-        abstract = self.query_one("#abstract", Input).value
-        category = self.query_one("#category", Select).value
-        start_year_val = self.query_one("#start_year", Select).value
-        start_year = int(start_year_val) if start_year_val != Select.BLANK else None
-        start_month_val = self.query_one("#start_month", Select).value
-        start_month = int(start_month_val) if start_month_val != Select.BLANK else None
-        start_day_val = self.query_one("#start_day", Select).value
-        start_day = int(start_day_val) if start_day_val != Select.BLANK else None
-        end_year_val = self.query_one("#end_year", Select).value
-        end_year = int(end_year_val) if end_year_val != Select.BLANK else None
-        end_month_val = self.query_one("#end_month", Select).value
-        end_month = int(end_month_val) if end_month_val != Select.BLANK else None
-        end_day_val = self.query_one("#end_day", Select).value
-        end_day = int(end_day_val) if end_day_val != Select.BLANK else None
-        max_results = int(self.query_one("#max_results", Input).value or 10)
+        # a disabled button means a search is already in flight
+        if self._search_button.disabled:
+            return
+        start_year = _select_int(self._start_year)
+        start_month = _select_int(self._start_month)
+        start_day = _select_int(self._start_day)
+        end_year = _select_int(self._end_year)
+        end_month = _select_int(self._end_month)
+        end_day = _select_int(self._end_day)
+        max_results = int(self._max_results_input.value or 10)
 
         # Build dates
         start_date = None
@@ -93,18 +150,15 @@ class SearchTab(Vertical):
             start_month = start_month or 1
             start_day = start_day or 1
             try:
-                start_date = datetime(int(start_year), int(start_month), int(start_day))
+                start_date = datetime(start_year, start_month, start_day)
             except ValueError:
                 self.app.notify("Invalid start date", severity="error")
                 return
         if end_year:
             end_month = end_month or 12
-            if end_month == 12:
-                end_day = end_day or 31
-            else:
-                end_day = end_day or calendar.monthrange(int(end_year), int(end_month))[1]
+            end_day = end_day or calendar.monthrange(end_year, end_month)[1]
             try:
-                end_date = datetime(int(end_year), int(end_month), int(end_day))
+                end_date = datetime(end_year, end_month, end_day)
             except ValueError:
                 self.app.notify("Invalid end date", severity="error")
                 return
@@ -115,69 +169,54 @@ class SearchTab(Vertical):
         end_date = end_date.isoformat() if end_date else None
 
         # Build query
-        from arxiv_sdk.query import QueryBuilder
-        qb = QueryBuilder()
-        if title:
-            qb.title(title)
-        if author:
-            qb.author(author)
-        if abstract:
-            qb.abstract(abstract)
-        if category:
-            qb.category(category)
-        if start_date and end_date:
-            qb.date_range(start_date, end_date)
-
-        # Perform search
+        qb = QueryBuilder.from_params(
+            title=self._title_input.value,
+            author=self._author_input.value,
+            abstract=self._abstract_input.value,
+            category=None if self._category_select.value is Select.BLANK else self._category_select.value,
+            date_range=(start_date, end_date) if start_date and end_date else None,
+        )
+
+        # Perform search; disabling the button drops clicks made while waiting
+        self._search_button.disabled = True
         try:
             results = await self.app.client.search(qb, max_results=max_results)
             self.display_results(results.entries)
         except Exception as e:
             self.app.notify(f"Search failed: {e}", severity="error")
+        finally:
+            self._search_button.disabled = False
 
     def display_results(self, papers):
         """Display results in table."""
         self.papers = papers
-        table = self.query_one("#results_table", DataTable)
+        self._paper_by_id = {p.id: p for p in papers}
+        table = self._results_table
+        # clear() drops rows only; the column set never changes after the first search
         table.clear()
-        table.columns.clear()
-        table.add_columns("Title", "Authors", "Date", "Category")
-        for paper in papers:
-            authors = ", ".join(a.name for a in paper.authors[:2])
-            if len(paper.authors) > 2:
-                authors += " et al."
-            table.add_row(
-                paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
-                authors,
-                paper.published.strftime("%Y-%m-%d") if paper.published else "N/A",
-                paper.primary_category or "N/A",
-                key=paper.id
-            )
+        if not self._columns_added:
+            table.add_columns("Title", "Authors", "Date", "Category")
+            self._columns_added = True
+        # one screen update for the whole result set
+        with self.app.batch_update():
+            for paper in papers:
+                table.add_row(*result_row(paper), key=paper.id)
 
     @on(DataTable.HeaderSelected, "#results_table")
     def on_header_selected(self, event: DataTable.HeaderSelected) -> None:
         """Handle header click for sorting."""
-        table = self.query_one("#results_table", DataTable)
+        table = self._results_table
         column = event.column_index
-        reverse = self.sort_reverse.get(column, False)
-        if column == 0:  # Title
-            key = lambda row: row[0].lower()
-        elif column == 1:  # Authors
-            key = lambda row: row[1].lower()
-        elif column == 2:  # Date
-            key = lambda row: datetime.strptime(row[2], "%Y-%m-%d") if row[2] != "N/A" else datetime.min
-        elif column == 3:  # Category
-            key = lambda row: row[3].lower() if row[3] != "N/A" else ""
-        else:
+        if not 0 <= column < len(_SORT_KEYS):
             return
-        table.sort(key=key, reverse=reverse)
+        reverse = self.sort_reverse.get(column, False)
+        # sort() evaluates the key once per row, not once per comparison
+        table.sort(key=_SORT_KEYS[column], reverse=reverse)
         self.sort_reverse[column] = not reverse
 
     @on(DataTable.RowSelected)
     def row_selected(self, event):
         """Handle row selection."""
-        paper_id = event.row_key
-        paper = next((p for p in self.papers if p.id == paper_id), None)
+        paper = self._paper_by_id.get(event.row_key.value)
         if paper:
-            from .view_paper import PaperDetailsScreen
             self.app.push_screen(PaperDetailsScreen(paper=paper))
\ No newline at end of file
@@ -1,8 +1,14 @@
 """Search tab for the TUI."""
+import asyncio
+from functools import partial
+
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Input, Button, Label, Static, DataTable
 from textual import on
 
+from .results import short_authors, truncate
+from .view_paper import PaperDetailsScreen
+
 
 class SemanticScholarSearchTab(Vertical):
     """Tab for entering search parameters and viewing results."""
@@ -10,75 +16,95 @@ class SemanticScholarSearchTab(Vertical):
     def __init__(self):
         super().__init__()
         self.papers = []
+        self._paper_by_id = {}
+        self._columns_added = False
 
     def compose(self):
+        # Keep widget references so the event handlers never walk the DOM
+        self._title_input = Input(placeholder="Enter title keywords", id="title")
+        self._author_input = Input(placeholder="Enter author name", id="author")
+        self._venue_input = Input(placeholder="Enter venue (e.g., arXiv)", id="venue")
+        self._max_results_input = Input(value="10", placeholder="Max results", id="max_results")
+        self._search_button = Button("Search", id="search", variant="primary")
+        self._results_table = DataTable(cursor_type="row", show_cursor=True, id="results_table")
+
         with Horizontal():
             with Vertical(id="search_panel"):
                 yield Static("Search Papers", classes="title")
                 with ScrollableContainer():
                     yield Label("Title:")
-                    yield Input(placeholder="Enter title keywords", id="title")
+                    yield self._title_input
                     yield Label("Author:")
-                    yield Input(placeholder="Enter author name", id="author")
+                    yield self._author_input
                     yield Label("Abstract:")
                     yield Input(placeholder="Enter abstract keywords", id="abstract")
                     yield Label("Venue:")
-                    yield Input(placeholder="Enter venue (e.g., arXiv)", id="venue")
+                    yield self._venue_input
                     yield Label("Max Results:")
-                    yield Input(value="10", placeholder="Max results", id="max_results")
-                    yield Button("Search", id="search", variant="primary")
+                    yield self._max_results_input
+                    yield self._search_button
             with Vertical(id="results_panel"):
-                 yield DataTable(cursor_type="row", show_cursor=True, id="results_table")
+                 yield self._results_table
 
     @on(Button.Pressed, "#search")
     async def search(self) -> None:
         """Perform search and display results."""
-        title = self.query_one("#title", Input).value
-        author = self.query_one("#author", Input).value
-        venue = self.query_one("#venue", Input).value
-        max_results = int(self.query_one("#max_results", Input).value or 10)
+        # a disabled button means a search is already in flight
+        if self._search_button.disabled:
+            return
+        max_results = int(self._max_results_input.value or 10)
 
         # Build query string
         query_parts = []
-        if title:
-            query_parts.append(f"title:{title}")
-        if author:
-            query_parts.append(f"author:{author}")
-        if venue:
-            query_parts.append(f"venue:{venue}")
+        for prefix, widget in (
+            ("title", self._title_input),
+            ("author", self._author_input),
+            ("venue", self._venue_input),
+        ):
+            value = widget.value
+            if value:
+                query_parts.append(f"{prefix}:{value}")
         query = " ".join(query_parts) if query_parts else ""
 
-        # Perform search
+        # Perform search; disabling the button drops clicks made while waiting
+        self._search_button.disabled = True
         try:
-            results = await self.app.ss_client.search(query or "machine learning", limit=max_results)
+            # the Semantic Scholar client is synchronous; keep its shared
+            # requests session off the event loop
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                None, partial(self.app.ss_client.search, query or "machine learning", limit=max_results)
+            )
             self.display_results(results)
         except Exception as e:
             self.app.notify(f"Search failed: {e}", severity="error")
+        finally:
+            self._search_button.disabled = False
 
     def display_results(self, papers):
         """Display results in table."""
         self.papers = papers
-        table = self.query_one("#results_table", DataTable)
+        self._paper_by_id = {p.id: p for p in papers}
+        table = self._results_table
+        # clear() drops rows only; the column set never changes after the first search
         table.clear()
-        table.columns = []
-        table.add_columns("Title", "Authors", "Year", "Venue")
-        for paper in papers:
-            authors = ", ".join(a.name for a in paper.authors[:2])
-            if len(paper.authors) > 2:
-                authors += " et al."
-            table.add_row(
-                paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
-                authors,
-                str(paper.year) if paper.year else "N/A",
-                paper.venue or "N/A",
-                key=paper.id
-            )
+        if not self._columns_added:
+            table.add_columns("Title", "Authors", "Year", "Venue")
+            self._columns_added = True
+        # one screen update for the whole result set
+        with self.app.batch_update():
+            for paper in papers:
+                table.add_row(
+                    truncate(paper.title),
+                    short_authors(paper.authors),
+                    str(paper.year) if paper.year else "N/A",
+                    paper.venue or "N/A",
+                    key=paper.id
+                )
 
     @on(DataTable.RowSelected)
     def row_selected(self, event):
         """Handle row selection."""
-        paper_id = event.row_key
-        paper = next((p for p in self.papers if p.id == paper_id), None)
+        paper = self._paper_by_id.get(event.row_key.value)
         if paper:
-            from .view_paper import PaperDetailsScreen
             self.app.push_screen(PaperDetailsScreen(paper=paper))
\ No newline at end of file
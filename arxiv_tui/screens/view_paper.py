@@ -1,10 +1,37 @@
 """View paper screen."""
+import os
+import webbrowser
+
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.screen import Screen
 from textual.widgets import Button, Static, Label, Header
 from textual import on
 
-import webbrowser
+
+def _format_date(value) -> str:
+    if not value:
+        return "N/A"
+    return value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else str(value)
+
+
+def _metadata_widgets(meta: dict, authors: str):
+    """Widgets for a paper given as a metadata dict (a sidecar or a searched paper's fields)."""
+    yield Label(f"Title: {meta.get('title', 'N/A')}")
+    yield Label(f"Authors: {authors or 'N/A'}")
+    yield Label(f"Published: {_format_date(meta.get('published'))}")
+    yield Label(f"Updated: {_format_date(meta.get('updated'))}")
+    # Show categories or venue
+    if meta.get('primary_category'):
+        yield Label(f"Category: {meta['primary_category']}")
+    if meta.get('venue'):
+        yield Label(f"Venue: {meta['venue']}")
+    if meta.get('citation_count') is not None:
+        yield Label(f"Citations: {meta['citation_count']}")
+    if meta.get('influential_citation_count') is not None:
+        yield Label(f"Influential Citations: {meta['influential_citation_count']}")
+    yield Label(f"DOI: {meta.get('doi') or 'N/A'}")
+    yield Label("Abstract:")
+    yield Static(meta.get('summary') or 'No abstract available', classes="abstract")
 
 
 class PaperDetailsScreen(Screen):
@@ -34,6 +61,26 @@ class PaperDetailsScreen(Screen):
         self.data = data
         self.filename = filename
         self.pdf_path = pdf_path
+        self._browser_url = f"file://{os.path.abspath(pdf_path)}" if pdf_path else None
+        # searched papers go through the same renderer as downloaded sidecars
+        if paper is not None:
+            # only the fields the renderer reads; reuse the paper's cached display dates
+            self._meta = {
+                'title': paper.title,
+                'published': paper.published_str,
+                'updated': paper.updated_str,
+                'primary_category': paper.primary_category,
+                'venue': paper.venue,
+                'citation_count': paper.citation_count,
+                'influential_citation_count': paper.influential_citation_count,
+                'doi': paper.doi,
+                'summary': paper.summary,
+            }
+            self._authors_str = paper.authors_str
+        else:
+            self._meta = data
+            authors = data.get('authors') if data else None
+            self._authors_str = ", ".join([a.get('name', '') for a in authors]) if authors else ""
 
     def compose(self):
         yield Header()
@@ -41,46 +88,8 @@ class PaperDetailsScreen(Screen):
             title_text = "Paper Details" if self.paper else f"Downloaded Paper: {self.filename}"
             yield Static(title_text, classes="title")
             with Vertical(classes="content"):
-                if self.paper:
-                    yield Label(f"Title: {self.paper.title}")
-                    authors = ", ".join(a.name for a in self.paper.authors)
-                    yield Label(f"Authors: {authors}")
-                    yield Label(f"Published: {self.paper.published.strftime('%Y-%m-%d') if self.paper.published else 'N/A'}")
-                    yield Label(f"Updated: {self.paper.updated.strftime('%Y-%m-%d') if self.paper.updated else 'N/A'}")
-                    yield Label(f"Category: {self.paper.primary_category}")
-                    yield Label(f"DOI: {self.paper.doi or 'N/A'}")
-                    yield Label("Abstract:")
-                    yield Static(self.paper.summary, classes="abstract")
-                elif self.data:
-                    yield Label(f"Title: {self.data.get('title', 'N/A')}")
-                    authors = self.data.get('authors', [])
-                    if authors:
-                        author_names = ", ".join(a.get('name', '') for a in authors)
-                        yield Label(f"Authors: {author_names}")
-                    else:
-                        yield Label("Authors: N/A")
-                    published = self.data.get('published')
-                    if published:
-                        yield Label(f"Published: {published.strftime('%Y-%m-%d') if hasattr(published, 'strftime') else str(published)}")
-                    else:
-                        yield Label("Published: N/A")
-                    updated = self.data.get('updated')
-                    if updated:
-                        yield Label(f"Updated: {updated.strftime('%Y-%m-%d') if hasattr(updated, 'strftime') else str(updated)}")
-                    else:
-                        yield Label("Updated: N/A")
-                    # Show categories or venue
-                    if self.data.get('primary_category'):
-                        yield Label(f"Category: {self.data.get('primary_category', 'N/A')}")
-                    if self.data.get('venue'):
-                        yield Label(f"Venue: {self.data.get('venue', 'N/A')}")
-                    if self.data.get('citation_count') is not None:
-                        yield Label(f"Citations: {self.data.get('citation_count', 'N/A')}")
-                    if self.data.get('influential_citation_count') is not None:
-                        yield Label(f"Influential Citations: {self.data.get('influential_citation_count', 'N/A')}")
-                    yield Label(f"DOI: {self.data.get('doi') or 'N/A'}")
-                    yield Label("Abstract:")
-                    yield Static(self.data.get('summary', 'No abstract available'), classes="abstract")
+                if self._meta:
+                    yield from _metadata_widgets(self._meta, self._authors_str)
         with Horizontal():
             if self.paper and self.paper.pdf_url:
                 yield Button("Download PDF", id="download", variant="primary")
@@ -100,10 +109,9 @@ class PaperDetailsScreen(Screen):
     @on(Button.Pressed, "#open_browser")
     def open_in_browser(self):
         """Open PDF in browser."""
-        if self.pdf_path:
+        if self._browser_url:
             # Downloaded paper
-            import os
-            webbrowser.open(f"file://{os.path.abspath(self.pdf_path)}")
+            webbrowser.open(self._browser_url)
             self.app.notify("Opened in browser", severity="information")
         elif self.paper and self.paper.pdf_url:
             # Searched paper
@@ -1,252 +1,433 @@
 """Client for Semantic Scholar API."""
+import copy
 import os
+import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import logging
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, ClassVar, Optional, List, Dict, Any
+from academic_sdk.base_client import _retry_after_seconds
+from academic_sdk.cache import TTLCache, _cache_key, open_disk_cache
 from academic_sdk.models import Paper
 from academic_sdk.errors import AcademicNetworkError, AcademicParseError
-from .models import SemanticScholarPaper
+from .models import SemanticScholarPaper, JSON_DECODER, PAPER_PAGE_DECODER, PAPER_LIST_DECODER, PAPER_OPTIONAL_LIST_DECODER
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_retry_after(response) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header, if the response has one."""
+    if response is None:
+        return None
+    return _retry_after_seconds(response.headers.get("Retry-After"))
+
+
+def _decode_json(resp) -> Any:
+    if JSON_DECODER is not None:
+        return JSON_DECODER.decode(resp.content)
+    return resp.json()
+
+
+def _paper_from_json(item: Dict[str, Any]) -> SemanticScholarPaper:
+    """Build a paper from a decoded API object; the fallback twin of ``PaperStruct.to_paper``."""
+    try:
+        paper_id = item["paperId"]
+        title = item["title"]
+    except KeyError as e:
+        # same wording as msgspec's ValidationError, instead of a bare "'paperId'"
+        raise AcademicParseError(f"Object missing required field `{e.args[0]}`") from e
+    references = item.get("references")
+    citations = item.get("citations")
+    return SemanticScholarPaper(
+        id=paper_id,
+        title=title,
+        summary=item.get("abstract"),
+        authors=item.get("authors") or [],
+        year=item.get("year"),
+        venue=item.get("venue"),
+        open_access_pdf=item.get("openAccessPdf"),
+        references=None if references is None else [{"title": r.get("title"), "paperId": r.get("paperId")} for r in references],
+        citations=None if citations is None else [{"title": c.get("title"), "paperId": c.get("paperId")} for c in citations],
+    )
+
+
 class SemanticScholarClient:
     """Client for Semantic Scholar Academic Graph API."""
 
+    __slots__ = ("api_key", "user_agent", "session", "_failures", "_circuit_open_until", "_breaker_lock", "_cache", "_disk_cache", "_etags")
+
     BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    # After this many consecutive failed calls, fail fast for CIRCUIT_COOLDOWN seconds
+    FAILURE_THRESHOLD = 5
+    CIRCUIT_COOLDOWN = 30.0
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 100
+    FAN_OUT_WORKERS = 10
+    MAX_IDS_PER_BATCH = 500  # /paper/batch limit
+    SEARCH_PAGE_SIZE = 100  # /paper/search limit per request
+    SEARCH_MAX_RESULTS = 1000  # /paper/search serves no results past offset + limit = 1000
+    DISK_CACHE_TTL = 86400.0
+    ETAG_TTL = 86400.0  # how long a validator and its body are kept for revalidation
+
+    # URLs and field lists that do not vary per call, built once
+    _PAPER_URL = BASE_URL + "/paper"
+    _AUTHOR_URL = BASE_URL + "/author"
+    _SEARCH_URL = _PAPER_URL + "/search"
+    _BATCH_URL = _PAPER_URL + "/batch"
+    _AUTOCOMPLETE_URL = _PAPER_URL + "/autocomplete"
+    _AUTHOR_SEARCH_URL = _AUTHOR_URL + "/search"
+    _SEARCH_FIELDS = "title,abstract,authors,year,venue"
+    _PAPER_FIELDS = _SEARCH_FIELDS + ",references,citations"
+    _AUTHOR_SEARCH_FIELDS = "name,paperCount,citationCount"
+    _LINK_FIELDS = "title,paperId"
+    # requests never mutates params, so fields-only dicts can be shared
+    _SEARCH_PARAMS = {"fields": _SEARCH_FIELDS}
+    _PAPER_PARAMS = {"fields": _PAPER_FIELDS}
+    _AUTHOR_PARAMS = {"fields": "name,papers,citationCount"}
+
+    # Connection pool shared by every client in the process, created on first use
+    _shared_adapter: ClassVar[Optional[HTTPAdapter]] = None
+    _shared_adapter_lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self, api_key: Optional[str] = None, user_agent: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, user_agent: Optional[str] = None, cache_ttl: float = 600.0, cache_size: int = 4096,
+                 cache_dir: Optional[str] = None, use_shared: bool = True):
         self.api_key = api_key or os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
         self.user_agent = user_agent or "SemanticScholarSDK/1.0"
         self.session = requests.Session()
+        # sessions stay per client (headers carry the API key), but by default
+        # they share one keep-alive pool so new clients reuse open connections
+        adapter = self._get_shared_adapter() if use_shared else self._new_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({"User-Agent": self.user_agent})
         if self.api_key:
             self.session.headers.update({"x-api-key": self.api_key})
+        self._failures = 0
+        self._circuit_open_until = 0.0
+        # _fan_out shares one client across threads; guards the two fields above
+        self._breaker_lock = threading.Lock()
+        # lookups by id are idempotent; a cache_ttl of 0 disables caching
+        self._cache = TTLCache(cache_size, cache_ttl) if cache_ttl > 0 else None
+        # (ETag, body) per lookup, so expired entries are revalidated with If-None-Match
+        self._etags = TTLCache(cache_size, self.ETAG_TTL) if self._cache is not None else None
+        # optional on-disk layer that survives restarts, e.g. across script or test runs
+        self._disk_cache = open_disk_cache(cache_dir) if cache_dir else None
+
+    @classmethod
+    def _new_adapter(cls) -> HTTPAdapter:
+        # a larger keep-alive pool for threaded callers; retries stay with _retry_request
+        return HTTPAdapter(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE, max_retries=0)
+
+    @classmethod
+    def _get_shared_adapter(cls) -> HTTPAdapter:
+        with cls._shared_adapter_lock:
+            if cls._shared_adapter is None:
+                cls._shared_adapter = cls._new_adapter()
+            return cls._shared_adapter
+
+    def _is_retryable(self, e: requests.RequestException) -> bool:
+        """Whether ``e`` is transient: no response at all, a 408, a 429 or a 5xx."""
+        response = e.response
+        if response is None:
+            return True
+        status = response.status_code
+        return status in (408, 429) or 500 <= status < 600
+
+    def _record_failure(self) -> None:
+        with self._breaker_lock:
+            self._failures += 1
+            failures = self._failures
+            if failures >= self.FAILURE_THRESHOLD:
+                # while open, calls fail fast; the first call after the cooldown probes
+                # the API and a failure re-opens the circuit straight away
+                self._circuit_open_until = time.monotonic() + self.CIRCUIT_COOLDOWN
+        if failures >= self.FAILURE_THRESHOLD:
+            logger.warning("Semantic Scholar failed %d times in a row; failing fast for %.0f seconds", failures, self.CIRCUIT_COOLDOWN)
 
     def _retry_request(self, request_func, max_retries=3):
-        """Retry requests with exponential backoff."""
-        backoff = 1
+        """Retry requests with decorrelated-jitter backoff.
+
+        Other 4xx responses are raised immediately. A ``Retry-After`` header
+        takes precedence over the computed backoff. Repeated transient failures
+        open a circuit breaker that raises ``AcademicNetworkError`` without
+        touching the network until ``CIRCUIT_COOLDOWN`` has passed.
+        """
+        with self._breaker_lock:
+            circuit_open = time.monotonic() < self._circuit_open_until
+        if circuit_open:
+            raise AcademicNetworkError("Semantic Scholar API unavailable; circuit open after repeated failures")
+        backoff = 1.0
         for attempt in range(max_retries):
             try:
-                return request_func()
+                result = request_func()
             except requests.RequestException as e:
-                if attempt == max_retries - 1:
+                retryable = self._is_retryable(e)
+                if attempt == max_retries - 1 or not retryable:
+                    if retryable:
+                        self._record_failure()
                     raise
-                if hasattr(e.response, 'status_code') and e.response.status_code == 429:
-                    logger.warning("Rate limited (429), retrying in %d seconds: %s", backoff, e)
-                else:
-                    logger.warning("Request failed, retrying in %d seconds: %s", backoff, e)
-                time.sleep(backoff)
-                backoff = min(backoff * 2, 30)
+                # jitter keeps clients that failed together from retrying together
+                backoff = min(30.0, random.uniform(1.0, backoff * 3))
+                retry_after = _parse_retry_after(e.response)
+                delay = retry_after if retry_after is not None else backoff
+                logger.warning("Request failed (attempt %d/%d), retrying in %.1f seconds: %s", attempt + 1, max_retries, delay, e)
+                time.sleep(delay)
+            else:
+                with self._breaker_lock:
+                    self._failures = 0
+                return result
         raise AcademicNetworkError("Max retries exceeded")
 
+    def _get_json(self, url: str, params: Dict[str, Any]) -> Any:
+        """GET ``url`` with retries and return the decoded JSON body.
+
+        Fresh responses are served from the in-process cache, then from the
+        ``cache_dir`` cache if one is configured. Cached values are shared, so
+        public methods copy anything they hand back to the caller. Past that, a body seen with an ``ETag`` is
+        revalidated and reused on ``304 Not Modified``.
+        """
+        key = (url, tuple(sorted(params.items())))
+        if self._cache is not None:
+            data = self._cache.get(key)
+            if data is not None:
+                return data
+        if self._disk_cache is not None:
+            disk_key = _cache_key(url, params)
+            data = self._disk_cache.get(disk_key)
+            if data is not None:
+                if self._cache is not None:
+                    self._cache.set(key, data)
+                return data
+
+        validator = self._etags.get(key) if self._etags is not None else None
+
+        def request_func():
+            headers = {"If-None-Match": validator[0]} if validator is not None else None
+            resp = self.session.get(url, params=params, headers=headers)
+            if validator is not None and resp.status_code == 304:
+                return validator[1]
+            resp.raise_for_status()
+            body = _decode_json(resp)
+            etag = resp.headers.get("ETag")
+            if etag and self._etags is not None:
+                self._etags.set(key, (etag, body))
+            return body
+
+        data = self._retry_request(request_func)
+        if self._cache is not None:
+            self._cache.set(key, data)
+        if self._disk_cache is not None:
+            self._disk_cache.set(disk_key, data, expire=self.DISK_CACHE_TTL)
+        return data
+
     def search(self, query: str, limit: int = 10, offset: int = 0) -> List[Paper]:
         """Search for papers."""
         def request_func():
-            url = f"{self.BASE_URL}/paper/search"
-            params = {"query": query, "limit": limit, "offset": offset, "fields": "title,abstract,authors,year,venue"}
-            resp = self.session.get(url, params=params)
+            params = {"query": query, "limit": limit, "offset": offset, "fields": self._SEARCH_FIELDS}
+            resp = self.session.get(self._SEARCH_URL, params=params)
             resp.raise_for_status()
-            return resp.json()
+            return resp
 
         try:
-            data = self._retry_request(request_func)
-            papers = []
-            for item in data.get("data", []):
-                paper = SemanticScholarPaper(
-                    id=item["paperId"],
-                    title=item["title"],
-                    summary=item.get("abstract"),
-                    authors=[{"name": a["name"]} for a in item.get("authors", [])],
-                    year=item.get("year"),
-                    venue=item.get("venue"),
-                    pdf_url=item.get("openAccessPdf", {}).get("url"),
-                )
-                papers.append(paper)
-            return papers
+            resp = self._retry_request(request_func)
+            if PAPER_PAGE_DECODER is not None:
+                return [p.to_paper() for p in PAPER_PAGE_DECODER.decode(resp.content).data]
+            return [_paper_from_json(item) for item in resp.json().get("data", [])]
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
+
+    def search_all(self, query: str, total: int, max_workers: Optional[int] = None) -> List[Paper]:
+        """Search for up to ``total`` papers, fetching result pages concurrently.
+
+        Pages of ``SEARCH_PAGE_SIZE`` are requested in parallel rather than one
+        after another; results keep the API's ranking order. The endpoint only
+        serves the first ``SEARCH_MAX_RESULTS`` hits, so a larger ``total``
+        raises ``ValueError``.
+        """
+        if total > self.SEARCH_MAX_RESULTS:
+            raise ValueError(f"total must be at most {self.SEARCH_MAX_RESULTS}, got {total}")
+        offsets = list(range(0, total, self.SEARCH_PAGE_SIZE))
+
+        def page(offset: int) -> List[Paper]:
+            return self.search(query, limit=min(self.SEARCH_PAGE_SIZE, total - offset), offset=offset)
+
+        return [paper for papers in self._fan_out(page, offsets, max_workers) for paper in papers]
 
     def get_by_id(self, paper_id: str) -> Optional[Paper]:
         """Get paper by ID."""
-        def request_func():
-            url = f"{self.BASE_URL}/paper/{paper_id}"
-            params = {"fields": "title,abstract,authors,year,venue,references,citations"}
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            return resp
-
         try:
-            resp = self._retry_request(request_func)
-            data = resp.json()
-            paper = SemanticScholarPaper(
-                id=data["paperId"],
-                title=data["title"],
-                summary=data.get("abstract"),
-                authors=[{"name": a["name"]} for a in data.get("authors", [])],
-                year=data.get("year"),
-                venue=data.get("venue"),
-                pdf_url=data.get("openAccessPdf", {}).get("url"),
-                references=[{"title": r.get("title"), "paperId": r["paperId"]} for r in data.get("references", [])],
-                citations=[{"title": c.get("title"), "paperId": c["paperId"]} for c in data.get("citations", [])],
-            )
-            return paper
+            return _paper_from_json(self._get_json(f"{self._PAPER_URL}/{paper_id}", self._PAPER_PARAMS))
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def search_authors(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search for authors."""
         def request_func():
-            url = f"{self.BASE_URL}/author/search"
-            params = {"query": query, "limit": limit, "fields": "name,paperCount,citationCount"}
-            resp = self.session.get(url, params=params)
+            params = {"query": query, "limit": limit, "fields": self._AUTHOR_SEARCH_FIELDS}
+            resp = self.session.get(self._AUTHOR_SEARCH_URL, params=params)
             resp.raise_for_status()
-            return resp.json()
+            return _decode_json(resp)
 
         try:
             data = self._retry_request(request_func)
             return data.get("data", [])
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def get_author_by_id(self, author_id: str) -> Optional[Dict[str, Any]]:
         """Get author details."""
-        def request_func():
-            url = f"{self.BASE_URL}/author/{author_id}"
-            params = {"fields": "name,papers,citationCount"}
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            return resp
-
         try:
-            resp = self._retry_request(request_func)
-            data = resp.json()
-            return data
+            return copy.deepcopy(self._get_json(f"{self._AUTHOR_URL}/{author_id}", self._AUTHOR_PARAMS))
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def get_paper_citations(self, paper_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get citations for a paper."""
-        def request_func():
-            url = f"{self.BASE_URL}/paper/{paper_id}/citations"
-            params = {"limit": limit, "fields": "title,paperId"}
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-
         try:
-            data = self._retry_request(request_func)
-            return data.get("data", [])
+            data = self._get_json(f"{self._PAPER_URL}/{paper_id}/citations", {"limit": limit, "fields": self._LINK_FIELDS})
+            return copy.deepcopy(data.get("data", []))
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def get_paper_references(self, paper_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get references for a paper."""
-        def request_func():
-            url = f"{self.BASE_URL}/paper/{paper_id}/references"
-            params = {"limit": limit, "fields": "title,paperId"}
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-
         try:
-            data = self._retry_request(request_func)
-            return data.get("data", [])
+            data = self._get_json(f"{self._PAPER_URL}/{paper_id}/references", {"limit": limit, "fields": self._LINK_FIELDS})
+            return copy.deepcopy(data.get("data", []))
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
+
+    def _fan_out(self, func: Callable[[Any], Any], ids: List[Any], max_workers: Optional[int]) -> List[Any]:
+        """Call ``func`` for every id on a thread pool; results follow ``ids``.
+
+        Requests overlap on the session's keep-alive pool instead of paying one
+        round trip after another. The first error is raised.
+        """
+        if not ids:
+            return []
+        workers = min(max_workers or self.FAN_OUT_WORKERS, len(ids))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(func, ids))
+
+    def batch_get_paper_citations(self, paper_ids: List[str], limit: int = 10, max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Get citations for several papers concurrently, in the order of ``paper_ids``."""
+        return self._fan_out(partial(self.get_paper_citations, limit=limit), paper_ids, max_workers)
+
+    def batch_get_paper_references(self, paper_ids: List[str], limit: int = 10, max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Get references for several papers concurrently, in the order of ``paper_ids``."""
+        return self._fan_out(partial(self.get_paper_references, limit=limit), paper_ids, max_workers)
 
     def get_recommendations(self, paper_ids: List[str], limit: int = 10) -> List[Paper]:
         """Get recommendations based on papers."""
         def request_func():
-            url = f"{self.BASE_URL}/paper/batch"
-            params = {"fields": "title,abstract,authors,year,venue"}
-            json_data = {"ids": paper_ids}
-            resp = self.session.post(url, params=params, json=json_data)
+            resp = self.session.post(self._BATCH_URL, params=self._SEARCH_PARAMS, json={"ids": paper_ids})
             resp.raise_for_status()
-            return resp.json()
+            return resp
 
         try:
-            data = self._retry_request(request_func)
+            resp = self._retry_request(request_func)
+            if PAPER_LIST_DECODER is not None:
+                return [p.to_paper() for p in PAPER_LIST_DECODER.decode(resp.content)]
             # For simplicity, return papers, but actually recommendations might need different endpoint
-            papers = []
-            for item in data:
-                paper = SemanticScholarPaper(
-                    id=item["paperId"],
-                    title=item["title"],
-                    summary=item.get("abstract"),
-                    authors=[{"name": a["name"]} for a in item.get("authors", [])],
-                    year=item.get("year"),
-                    venue=item.get("venue"),
-                    pdf_url=item.get("openAccessPdf", {}).get("url"),
-                )
-                papers.append(paper)
-            return papers
+            return [_paper_from_json(item) for item in resp.json()]
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def batch_get_papers(self, paper_ids: List[str]) -> List[Paper]:
         """Batch get papers by IDs."""
         def request_func():
-            url = f"{self.BASE_URL}/paper/batch"
-            params = {"fields": "title,abstract,authors,year,venue,references,citations"}
-            json_data = {"ids": paper_ids}
-            resp = self.session.post(url, params=params, json=json_data)
+            resp = self.session.post(self._BATCH_URL, params=self._PAPER_PARAMS, json={"ids": paper_ids})
             resp.raise_for_status()
             return resp
 
         try:
             resp = self._retry_request(request_func)
-            data = resp.json()
-            papers = []
-            for item in data:
-                paper = SemanticScholarPaper(
-                    id=item["paperId"],
-                    title=item["title"],
-                    summary=item.get("abstract"),
-                    authors=[{"name": a["name"]} for a in item.get("authors", [])],
-                    year=item.get("year"),
-                    venue=item.get("venue"),
-                    references=[{"title": r.get("title"), "paperId": r["paperId"]} for r in item.get("references", [])],
-                    citations=[{"title": c.get("title"), "paperId": c["paperId"]} for c in item.get("citations", [])],
-                )
-                papers.append(paper)
-            return papers
+            if PAPER_LIST_DECODER is not None:
+                return [p.to_paper() for p in PAPER_LIST_DECODER.decode(resp.content)]
+            return [_paper_from_json(item) for item in resp.json()]
+        except requests.RequestException as e:
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
+        except Exception as e:
+            raise AcademicParseError(str(e)) from e
+
+    def get_many_by_id(self, paper_ids: List[str]) -> List[Optional[Paper]]:
+        """Get several papers by ID through ``/paper/batch``.
+
+        Uses one request per ``MAX_IDS_PER_BATCH`` ids instead of one per paper.
+        Results follow the order of ``paper_ids``; unknown IDs map to ``None``.
+        """
+        results: List[Optional[Paper]] = []
+        try:
+            for start in range(0, len(paper_ids), self.MAX_IDS_PER_BATCH):
+                chunk = paper_ids[start:start + self.MAX_IDS_PER_BATCH]
+
+                def request_func(chunk=chunk):
+                    resp = self.session.post(self._BATCH_URL, params=self._PAPER_PARAMS, json={"ids": chunk})
+                    resp.raise_for_status()
+                    return resp
+
+                resp = self._retry_request(request_func)
+                if PAPER_OPTIONAL_LIST_DECODER is not None:
+                    results.extend(None if p is None else p.to_paper() for p in PAPER_OPTIONAL_LIST_DECODER.decode(resp.content))
+                    continue
+                results.extend(None if item is None else _paper_from_json(item) for item in resp.json())
+            return results
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def autocomplete(self, query: str) -> List[str]:
         """Get autocomplete suggestions."""
-        def request_func():
-            url = f"{self.BASE_URL}/paper/autocomplete"
-            params = {"query": query}
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            return resp.json()
-
         try:
-            data = self._retry_request(request_func)
+            data = self._get_json(self._AUTOCOMPLETE_URL, {"query": query})
             return [item["title"] for item in data.get("data", [])]
         except requests.RequestException as e:
-            raise AcademicNetworkError(e)
+            raise AcademicNetworkError(e) from e
+        except (AcademicNetworkError, AcademicParseError):
+            raise
         except Exception as e:
-            raise AcademicParseError(str(e))
+            raise AcademicParseError(str(e)) from e
 
     def close(self):
-        self.session.close()
\ No newline at end of file
+        # closing the shared pool would drop other clients' connections
+        if self.session.get_adapter(self.BASE_URL) is not self._shared_adapter:
+            self.session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
\ No newline at end of file
@@ -1,7 +1,62 @@
 """Models for Semantic Scholar SDK."""
+from typing import Any, Dict, List, Optional
+
 from academic_sdk.models import Paper
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 class SemanticScholarPaper(Paper):
     # Inherits all from Paper, can add specific fields if needed
-    pass
\ No newline at end of file
+    pass
+
+
+if msgspec is not None:
+    class PaperRefStruct(msgspec.Struct, frozen=True, gc=False):
+        paperId: Optional[str] = None
+        title: Optional[str] = None
+
+    class PaperStruct(msgspec.Struct, frozen=True, gc=False):
+        """Wire-format paper, decoded straight from JSON without Pydantic."""
+        paperId: str
+        title: str
+        abstract: Optional[str] = None
+        # kept as the API's own dicts; Author validation ignores extra keys
+        authors: List[Dict[str, Any]] = []
+        year: Optional[int] = None
+        venue: Optional[str] = None
+        openAccessPdf: Optional[Dict[str, Any]] = None
+        references: Optional[List[PaperRefStruct]] = None
+        citations: Optional[List[PaperRefStruct]] = None
+
+        def to_paper(self) -> SemanticScholarPaper:
+            return SemanticScholarPaper(
+                id=self.paperId,
+                title=self.title,
+                summary=self.abstract,
+                authors=self.authors,
+                year=self.year,
+                venue=self.venue,
+                open_access_pdf=self.openAccessPdf,
+                references=None if self.references is None else [{"title": r.title, "paperId": r.paperId} for r in self.references],
+                citations=None if self.citations is None else [{"title": c.title, "paperId": c.paperId} for c in self.citations],
+            )
+
+    class PaperPageStruct(msgspec.Struct, frozen=True, gc=False):
+        data: List[PaperStruct] = []
+
+    # Built once: msgspec specializes these decoders to the schema.
+    PAPER_PAGE_DECODER = msgspec.json.Decoder(PaperPageStruct)
+    PAPER_LIST_DECODER = msgspec.json.Decoder(List[PaperStruct])
+    # /paper/batch answers null for ids it does not know
+    PAPER_OPTIONAL_LIST_DECODER = msgspec.json.Decoder(List[Optional[PaperStruct]])
+    # untyped bodies (authors, citations, ...) still decode faster than with json
+    JSON_DECODER = msgspec.json.Decoder()
+else:
+    PAPER_PAGE_DECODER = None
+    PAPER_LIST_DECODER = None
+    PAPER_OPTIONAL_LIST_DECODER = None
+    JSON_DECODER = None
@@ -1,8 +1,9 @@
 """Unit tests for semantic_scholar_sdk client."""
+import json
 import pytest
 from unittest.mock import Mock, patch
 from semantic_scholar_sdk.client import SemanticScholarClient
-from academic_sdk.errors import AcademicNetworkError
+from academic_sdk.errors import AcademicNetworkError, AcademicParseError
 
 
 @pytest.fixture
@@ -22,6 +23,25 @@ def test_client_init_with_key():
     assert client.api_key == "test_key"
 
 
+def test_session_connection_pool(client):
+    """The session pool is sized for concurrent callers and does not retry on its own."""
+    adapter = client.session.get_adapter(client.BASE_URL)
+    assert adapter._pool_maxsize == client.POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
+def test_clients_share_connection_pool():
+    """Clients reuse one keep-alive pool unless opted out; closing one keeps it open."""
+    first = SemanticScholarClient(api_key="a")
+    second = SemanticScholarClient(api_key="b")
+    shared = first.session.get_adapter(first.BASE_URL)
+    assert second.session.get_adapter(second.BASE_URL) is shared
+    assert first.session.headers["x-api-key"] != second.session.headers["x-api-key"]
+    first.close()
+    assert SemanticScholarClient._shared_adapter is shared
+    assert SemanticScholarClient(use_shared=False).session.get_adapter(first.BASE_URL) is not shared
+
+
 @patch.dict('os.environ', {'SEMANTIC_SCHOLAR_API_KEY': 'env_key'})
 def test_client_init_with_env_key():
     """Test client initialization using environment variable."""
@@ -38,6 +58,7 @@ def test_search_success(mock_get, client):
             {"paperId": "123", "title": "Test Paper", "abstract": "Abstract", "authors": [{"name": "Author"}], "year": 2023, "venue": "Venue"}
         ]
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -57,6 +78,7 @@ def test_get_by_id_success(mock_get, client):
         "references": [{"title": "Ref", "paperId": "ref1"}],
         "citations": [{"title": "Cit", "paperId": "cit1"}]
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -67,6 +89,19 @@ def test_get_by_id_success(mock_get, client):
     assert len(paper.citations) == 1
 
 
+@patch('requests.Session.get')
+def test_get_by_id_missing_field(mock_get, client):
+    """A paper without a required field names the field in the parse error."""
+    mock_response = Mock()
+    mock_response.json.return_value = {"title": "Test Paper"}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    with pytest.raises(AcademicParseError, match="paperId"):
+        client.get_by_id("test_id")
+
+
 @patch('requests.Session.get')
 @patch('time.sleep')
 def test_backoff_on_429(mock_sleep, mock_get, client):
@@ -80,6 +115,7 @@ def test_backoff_on_429(mock_sleep, mock_get, client):
 
     mock_response_success = Mock()
     mock_response_success.json.return_value = {"data": []}
+    mock_response_success.content = b'{"data": []}'
     mock_response_success.raise_for_status = Mock()
 
     mock_get.side_effect = [
@@ -94,7 +130,8 @@ def test_backoff_on_429(mock_sleep, mock_get, client):
 
 
 @patch('requests.Session.get')
-def test_network_error(mock_get, client):
+@patch('time.sleep')
+def test_network_error(mock_sleep, mock_get, client):
     """Test network error handling."""
     import requests
     mock_get.side_effect = requests.RequestException("Network error")
@@ -108,6 +145,7 @@ def test_get_paper_citations(mock_get, client):
     """Test get_paper_citations."""
     mock_response = Mock()
     mock_response.json.return_value = {"data": [{"title": "Cit1", "paperId": "cit1"}]}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -121,6 +159,7 @@ def test_get_paper_references(mock_get, client):
     """Test get_paper_references."""
     mock_response = Mock()
     mock_response.json.return_value = {"data": [{"title": "Ref1", "paperId": "ref1"}]}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -137,6 +176,7 @@ def test_batch_get_papers(mock_post, client):
         {"paperId": "123", "title": "Paper1"},
         {"paperId": "456", "title": "Paper2"}
     ]
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_post.return_value = mock_response
 
@@ -150,6 +190,7 @@ def test_search_authors(mock_get, client):
     """Test search_authors."""
     mock_response = Mock()
     mock_response.json.return_value = {"data": [{"name": "Author1", "paperCount": 10}]}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -163,6 +204,7 @@ def test_get_author_by_id(mock_get, client):
     """Test get_author_by_id."""
     mock_response = Mock()
     mock_response.json.return_value = {"name": "Author1", "paperCount": 10}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
@@ -175,9 +217,203 @@ def test_autocomplete(mock_get, client):
     """Test autocomplete."""
     mock_response = Mock()
     mock_response.json.return_value = {"data": [{"title": "Suggestion1"}]}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_response.raise_for_status = Mock()
     mock_get.return_value = mock_response
 
     suggestions = client.autocomplete("query")
     assert len(suggestions) == 1
-    assert suggestions[0] == "Suggestion1"
\ No newline at end of file
+    assert suggestions[0] == "Suggestion1"
+
+
+def _http_error_response(status, headers=None):
+    import requests
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.raise_for_status.side_effect = requests.HTTPError(str(status), response=response)
+    return response
+
+
+@patch('requests.Session.get')
+@patch('time.sleep')
+def test_client_error_is_not_retried(mock_sleep, mock_get, client):
+    """A 404 is raised on the first attempt without sleeping."""
+    mock_get.return_value = _http_error_response(404)
+
+    with pytest.raises(AcademicNetworkError):
+        client.get_paper_citations("missing")
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch('requests.Session.get')
+@patch('time.sleep')
+def test_retry_after_header_sets_delay(mock_sleep, mock_get, client):
+    """A Retry-After header overrides the jittered backoff."""
+    ok = Mock()
+    ok.json.return_value = {"data": []}
+    ok.content = json.dumps(ok.json.return_value).encode()
+    ok.raise_for_status = Mock()
+    mock_get.side_effect = [_http_error_response(429, {"Retry-After": "7"}), ok]
+
+    client.get_paper_citations("123")
+    mock_sleep.assert_called_once_with(7.0)
+
+
+@patch('requests.Session.get')
+@patch('time.sleep')
+def test_retry_after_http_date(mock_sleep, mock_get, client):
+    """An HTTP-date Retry-After is turned into a relative delay."""
+    from email.utils import formatdate
+    import time as _time
+    ok = Mock()
+    ok.json.return_value = {"data": []}
+    ok.content = json.dumps(ok.json.return_value).encode()
+    ok.raise_for_status = Mock()
+    retry_at = formatdate(_time.time() + 60, usegmt=True)
+    mock_get.side_effect = [_http_error_response(503, {"Retry-After": retry_at}), ok]
+
+    client.get_paper_citations("123")
+    delay = mock_sleep.call_args[0][0]
+    assert 55 <= delay <= 60
+
+
+@patch.object(SemanticScholarClient, 'FAILURE_THRESHOLD', 2)
+@patch('requests.Session.get')
+@patch('time.sleep')
+def test_circuit_opens_after_repeated_failures(mock_sleep, mock_get, client):
+    """Once the threshold is reached, calls fail without touching the network."""
+    import requests
+    mock_get.side_effect = requests.ConnectionError("down")
+
+    for _ in range(2):
+        with pytest.raises(AcademicNetworkError):
+            client.search("test")
+    calls = mock_get.call_count
+
+    with pytest.raises(AcademicNetworkError, match="circuit open"):
+        client.search("test")
+    assert mock_get.call_count == calls
+
+
+@patch('requests.Session.get')
+def test_batch_get_paper_citations_keeps_order(mock_get, client):
+    """Fan-out results line up with the requested ids."""
+    def fake_get(url, params=None, **kwargs):
+        paper_id = url.rsplit("/", 2)[-2]
+        response = Mock()
+        response.json.return_value = {"data": [{"title": f"cites {paper_id}", "paperId": "x"}]}
+        response.content = json.dumps(response.json.return_value).encode()
+        response.raise_for_status = Mock()
+        return response
+    mock_get.side_effect = fake_get
+
+    results = client.batch_get_paper_citations(["a", "b", "c"], max_workers=3)
+    assert [r[0]["title"] for r in results] == ["cites a", "cites b", "cites c"]
+
+
+@patch('requests.Session.get')
+def test_search_all_fetches_pages_in_order(mock_get, client):
+    """Pages are requested by offset and flattened in ranking order."""
+    def fake_get(url, params=None):
+        offset = params["offset"]
+        response = Mock()
+        response.json.return_value = {"data": [
+            {"paperId": str(offset + i), "title": f"Paper {offset + i}"} for i in range(params["limit"])
+        ]}
+        response.content = json.dumps(response.json.return_value).encode()
+        response.raise_for_status = Mock()
+        return response
+    mock_get.side_effect = fake_get
+
+    papers = client.search_all("test", total=250)
+
+    assert [p.id for p in papers] == [str(i) for i in range(250)]
+    assert sorted(c.kwargs["params"]["limit"] for c in mock_get.call_args_list) == [50, 100, 100]
+
+
+@patch('requests.Session.get')
+def test_search_all_rejects_total_past_search_window(mock_get, client):
+    """/paper/search serves at most 1,000 results, so larger totals fail up front."""
+    with pytest.raises(ValueError):
+        client.search_all("test", total=1001)
+    mock_get.assert_not_called()
+
+
+@patch('requests.Session.get')
+def test_repeated_lookup_served_from_cache(mock_get, client):
+    """A second identical lookup does not hit the network."""
+    mock_response = Mock()
+    mock_response.json.return_value = {"name": "Author1", "paperCount": 10}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    assert client.get_author_by_id("auth123") == client.get_author_by_id("auth123")
+    assert mock_get.call_count == 1
+    assert SemanticScholarClient(cache_ttl=0)._cache is None
+
+
+@patch('requests.Session.get')
+def test_mutating_result_leaves_cache_intact(mock_get, client):
+    """Callers get their own copy, so editing it does not change later cache hits."""
+    mock_response = Mock()
+    mock_response.json.return_value = {"name": "Author1", "affiliations": ["Lab"]}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    client.get_author_by_id("auth123")["affiliations"].append("Elsewhere")
+    assert client.get_author_by_id("auth123")["affiliations"] == ["Lab"]
+    assert mock_get.call_count == 1
+
+
+@patch('requests.Session.get')
+def test_expired_entry_revalidated_with_etag(mock_get, client):
+    """Once the cache entry expires, a 304 reuses the body kept with its ETag."""
+    ok = Mock(status_code=200, headers={"ETag": '"v1"'})
+    ok.json.return_value = {"name": "Author1", "paperCount": 10}
+    ok.content = json.dumps(ok.json.return_value).encode()
+    ok.raise_for_status = Mock()
+    not_modified = Mock(status_code=304, headers={})
+    mock_get.side_effect = [ok, not_modified]
+
+    first = client.get_author_by_id("a1")
+    client._cache.clear()
+    assert client.get_author_by_id("a1") == first
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch('requests.Session.get')
+def test_cache_dir_persists_across_clients(mock_get, tmp_path):
+    """A second client with the same cache_dir is answered from disk."""
+    mock_response = Mock()
+    mock_response.json.return_value = {"name": "Author1", "paperCount": 10}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_response.raise_for_status = Mock()
+    mock_get.return_value = mock_response
+
+    first = SemanticScholarClient(cache_dir=str(tmp_path))
+    first.get_author_by_id("a1")
+    first.close()
+    second = SemanticScholarClient(cache_dir=str(tmp_path))
+    assert second.get_author_by_id("a1")["name"] == "Author1"
+    second.close()
+    assert mock_get.call_count == 1
+
+
+@patch('requests.Session.post')
+def test_get_many_by_id_uses_batch_endpoint(mock_post, client):
+    """Many ids go out in one batch request; unknown ids come back as None."""
+    payload = [{"paperId": "123", "title": "Paper1"}, None]
+    mock_response = Mock()
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode()
+    mock_response.raise_for_status = Mock()
+    mock_post.return_value = mock_response
+
+    papers = client.get_many_by_id(["123", "missing"])
+    assert mock_post.call_count == 1
+    assert papers[0].id == "123"
+    assert papers[1] is None
@@ -1,4 +1,6 @@
 """Unit tests for semantic_scholar_sdk models."""
+import pytest
+
 from semantic_scholar_sdk.models import SemanticScholarPaper
 
 
@@ -35,4 +37,16 @@ def test_optional_fields():
         references=[{"title": "Ref1", "paperId": "ref1"}]
     )
     assert paper.citation_count == 10
-    assert len(paper.references) == 1
\ No newline at end of file
+    assert len(paper.references) == 1
+
+
+def test_paper_struct_to_paper():
+    """Test the msgspec fast path decodes into SemanticScholarPaper."""
+    pytest.importorskip("msgspec")
+    from semantic_scholar_sdk.models import PAPER_LIST_DECODER
+    raw = b'[{"paperId": "1", "title": "T", "authors": [{"name": "A"}], "openAccessPdf": null, "extra": 1}]'
+    paper = PAPER_LIST_DECODER.decode(raw)[0].to_paper()
+    assert isinstance(paper, SemanticScholarPaper)
+    assert paper.id == "1"
+    assert paper.authors[0].name == "A"
+    assert paper.open_access_pdf is None